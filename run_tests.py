@@ -4,24 +4,59 @@ Test runner script for File Organizer.
 
 This script provides convenient commands to run different test suites.
 """
+import importlib.util
 import sys
 import subprocess
 from pathlib import Path
 
+import pytest
 
-def run_command(cmd, description):
-    """Run a shell command and handle errors."""
-    print(f"\n{'=' * 70}")
-    print(f"{description}")
-    print(f"{'=' * 70}")
-    result = subprocess.run(cmd, shell=True)
-    if result.returncode != 0:
-        print(f"\n❌ {description} failed with exit code {result.returncode}")
+
+def _finish(description, returncode):
+    """Report how a command ended and return whether it succeeded."""
+    if returncode != 0:
+        print(f"\n❌ {description} failed with exit code {int(returncode)}")
         return False
     print(f"\n✓ {description} completed successfully")
     return True
 
 
+def _print_banner(description):
+    """Print the heading shown before a command runs."""
+    print(f"\n{'=' * 70}")
+    print(f"{description}")
+    print(f"{'=' * 70}")
+
+
+def run_pytest(args, description):
+    """Run pytest in this process with the given arguments."""
+    _print_banner(description)
+    return _finish(description, pytest.main(args))
+
+
+def run_command(cmd, description):
+    """Run an external command, given as an argument list, and handle errors."""
+    _print_banner(description)
+    try:
+        returncode = subprocess.run(cmd).returncode
+    except FileNotFoundError:
+        print(f"\n{cmd[0]} is not installed; see requirements-dev.txt")
+        returncode = 127
+    return _finish(description, returncode)
+
+
+def parallel_args():
+    """
+    Return pytest-xdist options when the plugin is installed.
+
+    Test files are kept together on one worker (loadfile) so their
+    fixtures and module setup are not repeated across processes.
+    """
+    if importlib.util.find_spec("xdist") is None:
+        return []
+    return ["-n", "auto", "--dist", "loadfile"]
+
+
 def main():
     """Main test runner."""
     if len(sys.argv) < 2:
@@ -32,36 +67,47 @@ def main():
         print("  integration      - Run integration tests only")
         print("  coverage         - Run tests with coverage report")
         print("  fast             - Run tests without slow tests")
+        print("  incremental      - Run only tests affected by changes (pytest-testmon)")
+        print("  changed          - Run tests in modified files (pytest-picked)")
         print("  watch            - Run tests in watch mode")
         print("  specific <path>  - Run specific test file or directory")
         sys.exit(1)
 
     command = sys.argv[1]
+    parallel = parallel_args()
 
     if command == "all":
-        success = run_command("pytest tests/", "Running all tests")
+        success = run_pytest(["tests/", *parallel], "Running all tests")
 
     elif command == "unit":
-        success = run_command("pytest tests/unit/", "Running unit tests")
+        success = run_pytest(["tests/unit/", *parallel], "Running unit tests")
 
     elif command == "integration":
-        success = run_command("pytest tests/integration/", "Running integration tests")
+        success = run_pytest(["tests/integration/", *parallel], "Running integration tests")
 
     elif command == "coverage":
-        success = run_command(
-            "pytest tests/ --cov=src/file_organizer --cov-report=html --cov-report=term",
+        success = run_pytest(
+            ["tests/", *parallel, "--cov=src/file_organizer", "--cov-report=html", "--cov-report=term"],
             "Running tests with coverage"
         )
         if success:
             print("\n📊 Coverage report generated in htmlcov/index.html")
 
     elif command == "fast":
-        success = run_command('pytest tests/ -m "not slow"', "Running fast tests")
+        success = run_pytest(["tests/", *parallel, "-m", "not slow"], "Running fast tests")
+
+    elif command == "incremental":
+        # The first run records dependencies in .testmondata and runs everything
+        success = run_pytest(["--testmon", "tests/"], "Running tests affected by changes")
+
+    elif command == "changed":
+        success = run_pytest(["--picked"], "Running tests in modified files")
 
     elif command == "watch":
         try:
+            # pytest-watch reruns pytest on every change, so it stays a subprocess
             success = run_command(
-                "pytest-watch tests/",
+                ["pytest-watch", "tests/"],
                 "Running tests in watch mode"
             )
         except KeyboardInterrupt:
@@ -74,7 +120,7 @@ def main():
             print("Example: python run_tests.py specific tests/unit/test_organizer.py")
             sys.exit(1)
         test_path = sys.argv[2]
-        success = run_command(f"pytest {test_path}", f"Running tests in {test_path}")
+        success = run_pytest([test_path], f"Running tests in {test_path}")
 
     else:
         print(f"Unknown command: {command}")
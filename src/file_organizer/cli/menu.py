@@ -66,10 +66,11 @@ def add_custom_rule(organizer):
         return
 
     extensions = prompts.get_input("Enter extensions (comma-separated, e.g., .xlsx,.pptx)")
-    ext_list = [
-        ext.strip() if ext.strip().startswith('.') else f'.{ext.strip()}'
-        for ext in extensions.split(',') if ext.strip()
-    ]
+    ext_list = []
+    for ext in extensions.split(','):
+        ext = ext.strip()
+        if ext:
+            ext_list.append(ext if ext.startswith('.') else f'.{ext}')
 
     if ext_list:
         organizer.add_custom_rule(category, ext_list)
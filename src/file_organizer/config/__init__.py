@@ -1,6 +1,59 @@
 """Configuration module."""
 
-from .file_types import FILE_TYPES, SIZE_CATEGORIES
-from .settings import UNDO_LOG_FILE, HASH_CHUNK_SIZE
+from .file_types import (
+    FILE_TYPES,
+    SIZE_CATEGORIES,
+    EXTENSION_TO_CATEGORY,
+    SIZE_CATEGORY_BOUNDS,
+    SIZE_CATEGORY_UPPER_BOUNDS
+)
+from .settings import (
+    UNDO_LOG_FILE,
+    UNDO_LOG_FSYNC,
+    UNDO_READ_BLOCK_SIZE,
+    UNDO_WORKERS,
+    UNDO_BATCH_SIZE,
+    HASH_CACHE_FILE,
+    HASH_CACHE_BATCH_SIZE,
+    HASH_CHUNK_SIZE,
+    DIRECT_IO_THRESHOLD,
+    HASH_PREFIX_SIZE,
+    DUPLICATE_HASH_ALGORITHM,
+    HASH_WORKERS,
+    PARALLEL_HASH_MIN_FILES,
+    DUPLICATE_BATCH_FILES,
+    DELETE_OPEN_DIRS,
+    MOVE_WORKERS,
+    PARALLEL_MOVE_MIN_FILES,
+    MOVE_BATCH_SIZE,
+    SCAN_WORKERS,
+    OUTPUT_FLUSH_LINES
+)
 
-__all__ = ['FILE_TYPES', 'SIZE_CATEGORIES', 'UNDO_LOG_FILE', 'HASH_CHUNK_SIZE']
+__all__ = [
+    'FILE_TYPES',
+    'SIZE_CATEGORIES',
+    'EXTENSION_TO_CATEGORY',
+    'SIZE_CATEGORY_BOUNDS',
+    'SIZE_CATEGORY_UPPER_BOUNDS',
+    'UNDO_LOG_FILE',
+    'UNDO_LOG_FSYNC',
+    'UNDO_READ_BLOCK_SIZE',
+    'UNDO_WORKERS',
+    'UNDO_BATCH_SIZE',
+    'HASH_CACHE_FILE',
+    'HASH_CACHE_BATCH_SIZE',
+    'HASH_CHUNK_SIZE',
+    'DIRECT_IO_THRESHOLD',
+    'HASH_PREFIX_SIZE',
+    'DUPLICATE_HASH_ALGORITHM',
+    'HASH_WORKERS',
+    'PARALLEL_HASH_MIN_FILES',
+    'DUPLICATE_BATCH_FILES',
+    'DELETE_OPEN_DIRS',
+    'MOVE_WORKERS',
+    'PARALLEL_MOVE_MIN_FILES',
+    'MOVE_BATCH_SIZE',
+    'SCAN_WORKERS',
+    'OUTPUT_FLUSH_LINES'
+]
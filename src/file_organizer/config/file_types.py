@@ -44,3 +44,18 @@ SIZE_CATEGORIES = {
     'Large (100MB-1GB)': (100 * 1024 * 1024, 1024 * 1024 * 1024),
     'Huge (over 1GB)': (1024 * 1024 * 1024, float('inf'))
 }
+
+# Extension -> category, inverted from FILE_TYPES once at import. Categories
+# are walked in reverse so the first category listing an extension wins.
+EXTENSION_TO_CATEGORY = {
+    extension: category
+    for category, extensions in reversed(FILE_TYPES.items())
+    for extension in extensions
+}
+
+# Size categories as (upper bound, lower bound, name) sorted by upper bound,
+# with the upper bounds split out so a bucket can be found with bisect
+SIZE_CATEGORY_BOUNDS = sorted(
+    (upper, lower, name) for name, (lower, upper) in SIZE_CATEGORIES.items()
+)
+SIZE_CATEGORY_UPPER_BOUNDS = [upper for upper, _, _ in SIZE_CATEGORY_BOUNDS]
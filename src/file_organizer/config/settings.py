@@ -1,9 +1,87 @@
 """Application settings and configuration."""
 
+import importlib.util
+import os
 from pathlib import Path
 
-# Undo log file location
+# Undo log file location. The log is JSON Lines, but it keeps the name it had
+# as a single JSON array so logs from earlier versions are still found; the
+# format is told apart by the first byte.
 UNDO_LOG_FILE = Path.home() / '.file_organizer_undo.json'
 
+# Cache of file hashes reused between duplicate scans
+HASH_CACHE_FILE = Path.home() / '.file_organizer_hashes.sqlite3'
+
+# Rows written per transaction when saving new hashes to the cache
+HASH_CACHE_BATCH_SIZE = 1000
+
+# Whether saving the undo log waits for it, and the folder holding it, to reach
+# the disk. The log is saved after every batch of moves, so with this on a power
+# loss mid-run still leaves a log covering the moves already made, at the cost
+# of a sync per batch
+UNDO_LOG_FSYNC = False
+
+# Block size used when streaming the undo log backwards
+UNDO_READ_BLOCK_SIZE = 64 * 1024
+
+# Threads used to move files back when undoing; renames are metadata-bound
+# syscalls, so independent ones are issued concurrently
+UNDO_WORKERS = 16
+
+# Most undo operations queued for one concurrent round of renames
+UNDO_BATCH_SIZE = 1000
+
 # Hash algorithm settings
-HASH_CHUNK_SIZE = 4096
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are hashed with O_DIRECT reads where supported,
+# so a single pass over them does not evict the rest of the page cache
+DIRECT_IO_THRESHOLD = 64 * 1024 * 1024
+
+# Leading bytes hashed to rule out same-size files before a full read
+HASH_PREFIX_SIZE = 4096
+
+# Algorithm used to fingerprint file contents when looking for duplicates.
+# Hashes are only compared within a single scan, so a non-cryptographic hash
+# is enough: xxh3_128 is used when the optional xxhash package is installed,
+# then BLAKE3 from the optional blake3 package, otherwise BLAKE2b, which is
+# several times faster than MD5 and ships with the standard library.
+if importlib.util.find_spec('xxhash'):
+    DUPLICATE_HASH_ALGORITHM = 'xxh3_128'
+elif importlib.util.find_spec('blake3'):
+    DUPLICATE_HASH_ALGORITHM = 'blake3'
+else:
+    DUPLICATE_HASH_ALGORITHM = 'blake2b'
+
+# Threads used to hash duplicate candidates; reads release the GIL, so
+# oversubscribing the CPU count keeps the disk queue full
+HASH_WORKERS = min(32, (os.cpu_count() or 4) * 2)
+
+# Below this many candidate files, hashing runs on the calling thread since
+# starting a pool costs more than it saves
+PARALLEL_HASH_MIN_FILES = 16
+
+# Same-size candidates are hashed in batches of roughly this many files, so
+# duplicate groups are reported as each batch completes
+DUPLICATE_BATCH_FILES = 4096
+
+# Organize runs rename files on this many threads; each rename is an
+# independent metadata syscall that releases the GIL
+MOVE_WORKERS = 16
+
+# Below this many queued moves, files are renamed on the calling thread
+PARALLEL_MOVE_MIN_FILES = 8
+
+# Moves queued before they are carried out and logged for undo
+MOVE_BATCH_SIZE = 1000
+
+# Directory descriptors kept open while deleting duplicates; bounded so large
+# deletions stay well inside the process's open file limit
+DELETE_OPEN_DIRS = 256
+
+# Threads used to walk top-level subdirectories when analyzing; the walk is
+# dominated by directory and stat syscalls, so it is oversubscribed further
+SCAN_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# Per-file output lines are buffered and written to stdout in batches of this size
+OUTPUT_FLUSH_LINES = 1000
@@ -1,8 +1,60 @@
 """Directory analysis functionality."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from collections import defaultdict
-from ..utils.formatter import format_size, print_separator
+from ..config.settings import SCAN_WORKERS
+from ..utils.formatter import format_size, print_separator, OutputBuffer
+from ..utils.walk import file_extension, iter_files
+
+
+def _tally_extensions(entries):
+    """
+    Count files and bytes per extension.
+
+    Args:
+        entries: Iterable of os.DirEntry objects for files
+
+    Returns:
+        dict: Extension -> [file count, total size]
+    """
+    totals = {}
+    for entry in entries:
+        extension = file_extension(entry.name)
+        stats = totals.get(extension)
+        if stats is None:
+            stats = totals[extension] = [0, 0]
+        stats[0] += 1
+        stats[1] += entry.stat().st_size
+    return totals
+
+
+def _tally_subtree(path):
+    """Tally every file below a directory; runs on a worker thread."""
+    return _tally_extensions(iter_files(path))
+
+
+# os.fwalk hands out a descriptor for each directory, so children can be
+# removed relative to it instead of resolving their full path again
+_FD_RMDIR = hasattr(os, 'fwalk') and os.rmdir in os.supports_dir_fd
+
+
+def _walk_bottom_up(top):
+    """
+    Walk a tree bottom-up.
+
+    Args:
+        top: Directory to walk
+
+    Yields:
+        tuple: (dirpath, dirnames, filenames, dirfd); dirfd is None where
+            os.fwalk is unavailable
+    """
+    if _FD_RMDIR:
+        yield from os.fwalk(top, topdown=False)
+    else:
+        for dirpath, dirnames, filenames in os.walk(top, topdown=False):
+            yield dirpath, dirnames, filenames, None
 
 
 class DirectoryAnalyzer:
@@ -25,22 +77,50 @@ class DirectoryAnalyzer:
             directory: Directory to analyze
         """
         directory = Path(directory)
-        category_stats = defaultdict(lambda: {'count': 0, 'size': 0})
-        total_size = 0
-        total_files = 0
 
         print(f"\n📊 Analyzing: {directory}")
         print_separator()
 
-        for item in directory.rglob('*'):
-            if item.is_file():
-                size = item.stat().st_size
-                category = self.get_category(item.suffix)
-
-                category_stats[category]['count'] += 1
-                category_stats[category]['size'] += size
-                total_size += size
-                total_files += 1
+        top_level_files = []
+        subdirectories = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        top_level_files.append(entry)
+        except OSError:
+            pass
+
+        # Extension -> [file count, total size]; each subdirectory is walked
+        # on its own thread and merged here, so workers share no state
+        extension_stats = _tally_extensions(top_level_files)
+        if subdirectories:
+            workers = min(SCAN_WORKERS, len(subdirectories))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for subtree_stats in executor.map(_tally_subtree, subdirectories):
+                    for extension, (count, size) in subtree_stats.items():
+                        stats = extension_stats.get(extension)
+                        if stats is None:
+                            extension_stats[extension] = [count, size]
+                        else:
+                            stats[0] += count
+                            stats[1] += size
+
+        # Category -> [file count, total size]; each extension is
+        # categorized only once
+        category_stats = {}
+        for extension, (count, size) in extension_stats.items():
+            category = self.get_category(extension)
+            stats = category_stats.get(category)
+            if stats is None:
+                stats = category_stats[category] = [0, 0]
+            stats[0] += count
+            stats[1] += size
+
+        total_files = sum(count for count, _ in category_stats.values())
+        total_size = sum(size for _, size in category_stats.values())
 
         print(f"\nTotal Files: {total_files}")
         print(f"Total Size: {format_size(total_size)}\n")
@@ -49,26 +129,30 @@ class DirectoryAnalyzer:
         print_separator()
 
         sorted_categories = sorted(
-            category_stats.keys(),
-            key=lambda x: category_stats[x]['size'],
+            category_stats.items(),
+            key=lambda item: item[1][1],
             reverse=True
         )
 
-        for category in sorted_categories:
-            stats = category_stats[category]
-            percentage = (stats['size'] / total_size * 100) if total_size > 0 else 0
-            print(
-                f"{category:<20} "
-                f"{stats['count']:<10} "
-                f"{format_size(stats['size']):<15} "
-                f"{percentage:>5.1f}%"
-            )
+        with OutputBuffer() as output:
+            for category, (count, size) in sorted_categories:
+                percentage = (size / total_size * 100) if total_size > 0 else 0
+                output.add(
+                    f"{category:<20} "
+                    f"{count:<10} "
+                    f"{format_size(size):<15} "
+                    f"{percentage:>5.1f}%"
+                )
 
 
 def clean_empty_folders(directory, dry_run=False):
     """
     Remove empty folders.
 
+    Folders are visited bottom-up, so a parent left empty by removing its
+    empty children is removed in the same pass. Dry runs report the same
+    folders a real run would remove.
+
     Args:
         directory: Directory to clean
         dry_run: If True, don't actually delete
@@ -77,35 +161,41 @@ def clean_empty_folders(directory, dry_run=False):
         int: Number of folders removed
     """
     directory = Path(directory)
+    directory_str = os.fspath(directory)
     removed = 0
+    # Folders found empty so far; a parent whose subfolders are all in
+    # here (and that holds no files) is empty too
+    emptied = set()
 
     print(f"\n{'[DRY RUN] ' if dry_run else ''}Cleaning empty folders in: {directory}")
     print_separator()
 
-    # Keep iterating until no more empty folders are found
-    # This handles nested empty folders where removing a child makes parent empty
-    # In dry_run mode, we only iterate once since we don't actually remove folders
-    while True:
-        empty_dirs = []
+    # The walk joins names onto the top path, so slicing this prefix off
+    # gives the same relative path as os.path.relpath without its work
+    prefix_length = len(os.path.join(directory_str, ''))
+    action = '[WOULD DELETE]' if dry_run else '[DELETED]'
 
-        # Collect all empty directories (bottom-up by sorting by depth)
-        for item in sorted(directory.rglob('*'), key=lambda p: len(p.parts), reverse=True):
-            if item.is_dir() and not any(item.iterdir()):
-                empty_dirs.append(item)
-
-        if not empty_dirs:
-            break
-
-        # Remove all empty directories found in this iteration
-        for item in empty_dirs:
-            print(f"{'[WOULD DELETE]' if dry_run else '[DELETED]'} {item.relative_to(directory)}/")
+    with OutputBuffer() as output:
+        for dirpath, dirnames, filenames, dirfd in _walk_bottom_up(directory_str):
             if not dry_run:
-                item.rmdir()
+                # Subfolders found empty are removed once their parent is
+                # reached, relative to the parent's descriptor
+                for name in dirnames:
+                    child = os.path.join(dirpath, name)
+                    if child in emptied:
+                        if dirfd is None:
+                            os.rmdir(child)
+                        else:
+                            os.rmdir(name, dir_fd=dirfd)
+
+            if dirpath == directory_str or filenames:
+                continue
+            if any(os.path.join(dirpath, name) not in emptied for name in dirnames):
+                continue
+
+            output.add(f"{action} {dirpath[prefix_length:]}/")
+            emptied.add(dirpath)
             removed += 1
 
-        # In dry run mode, exit after first iteration to avoid infinite loop
-        if dry_run:
-            break
-
     print(f"\n✓ {'Would remove' if dry_run else 'Removed'} {removed} empty folders")
     return removed
@@ -1,6 +1,7 @@
 """Main FileOrganizer class."""
 
 from collections import defaultdict
+from ..utils.hash_cache import HashCache
 from ..utils.undo_manager import UndoManager
 from ..strategies.by_type import OrganizeByType
 from ..strategies.by_date import OrganizeByDate
@@ -14,6 +15,10 @@ class FileOrganizer:
 
     def __init__(self):
         self.custom_rules = {}
+        # Strategy reused for category lookups, and the custom rules it was
+        # built from; rebuilt whenever the rules differ
+        self._type_strategy = None
+        self._type_strategy_rules = None
         self.undo_manager = UndoManager()
         self.stats = {
             'files_moved': 0,
@@ -26,15 +31,22 @@ class FileOrganizer:
         """
         Get category for file extension.
 
+        The lookup strategy is kept between calls and rebuilt when
+        custom_rules has changed, including edits made to the dict in place.
+
         Args:
             extension: File extension
 
         Returns:
             str: Category name
         """
-        from ..strategies.by_type import OrganizeByType
-        strategy = OrganizeByType(custom_rules=self.custom_rules)
-        return strategy.get_category(extension)
+        rules = tuple(
+            (category, tuple(extensions)) for category, extensions in self.custom_rules.items()
+        )
+        if self._type_strategy is None or rules != self._type_strategy_rules:
+            self._type_strategy = OrganizeByType(custom_rules=dict(rules))
+            self._type_strategy_rules = rules
+        return self._type_strategy.get_category(extension)
 
     def organize_by_type(self, directory, dry_run=False):
         """Organize files by type."""
@@ -53,8 +65,9 @@ class FileOrganizer:
 
     def find_duplicates(self, directory, delete=False):
         """Find and optionally delete duplicate files."""
-        finder = DuplicateFinder()
-        duplicates = finder.find_duplicates(directory, delete)
+        with HashCache() as hash_cache:
+            finder = DuplicateFinder(hash_cache)
+            duplicates = finder.find_duplicates(directory, delete)
         self.stats['duplicates_found'] = finder.duplicates_found
         self.stats['space_saved'] = finder.space_saved
         return duplicates
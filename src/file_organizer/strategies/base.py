@@ -1,7 +1,80 @@
 """Base class for organization strategies."""
 
+import errno
+import os
+import shutil
+import sys
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from ..config.settings import MOVE_BATCH_SIZE, MOVE_WORKERS, PARALLEL_MOVE_MIN_FILES
+
+# Default filesystems on Windows and macOS ignore case, so names that only
+# differ in case are treated as clashing there
+_CASE_INSENSITIVE = os.name == 'nt' or sys.platform == 'darwin'
+
+
+# Moves are made as link + unlink on POSIX, where link() can leave a symbolic
+# link unresolved; the errors below mean links cannot be used for this file
+_LINK_RENAME = os.name != 'nt' and os.link in os.supports_follow_symlinks
+_LINK_UNSUPPORTED = {
+    errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOSYS,
+    errno.ENOTSUP, errno.EOPNOTSUPP,
+}
+
+
+def _name_key(name):
+    """Key under which a file name is tracked in a folder's set of used names."""
+    return name.casefold() if _CASE_INSENSITIVE else name
+
+
+def _rename(source, destination):
+    """
+    Move a file without ever replacing one at the destination.
+
+    On POSIX the file is hard-linked under its new name and the old name
+    is then removed. link() refuses an existing destination, so checking
+    and moving are one atomic step. Where hard links cannot be used
+    (Windows, moves across filesystems, or filesystems without hard
+    links) the
+    destination is checked and then renamed over, which is best-effort:
+    a file created between the two steps would be replaced. shutil.move
+    is only used when the destination is on another filesystem.
+
+    Args:
+        source: Source path as a string
+        destination: Destination path as a string
+
+    Raises:
+        FileExistsError: If something already exists at the destination
+    """
+    if _LINK_RENAME:
+        try:
+            os.link(source, destination, follow_symlinks=False)
+        except OSError as e:
+            if e.errno not in _LINK_UNSUPPORTED:
+                raise
+        else:
+            os.unlink(source)
+            return
+
+    if os.path.lexists(destination):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), destination)
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(source, destination)
+
+
+def _try_rename(move):
+    """Carry out a (source, destination) move; returns the error raised, if any."""
+    try:
+        _rename(*move)
+    except Exception as e:
+        return e
+    return None
 
 
 class OrganizationStrategy(ABC):
@@ -10,6 +83,11 @@ class OrganizationStrategy(ABC):
     def __init__(self, undo_manager=None):
         self.undo_manager = undo_manager
         self.files_processed = 0
+        self._used_names = {}
+        self._name_counters = {}
+        # (source, destination, requested destination, output, message)
+        # renames queued by _queue_move
+        self._pending_moves = []
 
     @abstractmethod
     def organize(self, directory, dry_run=False):
@@ -25,37 +103,234 @@ class OrganizationStrategy(ABC):
         """
         pass
 
-    def move_file(self, source, destination, dry_run=False):
+    def reset(self):
+        """Reset per-run counters and name caches before organizing."""
+        self.files_processed = 0
+        self._used_names = {}
+        self._name_counters = {}
+        self._pending_moves = []
+
+    def scan_files(self, directory):
         """
-        Move a file and log the operation.
+        List the files directly inside a directory.
+
+        Entries come from os.scandir, so their type and stat results are
+        served from the directory listing. Symbolic links to files are
+        included, as they always were. The undo log is left out so it
+        is never organized away.
+
+        On POSIX, files are returned in inode order, which the directory
+        listing provides for free. Inodes are allocated roughly in on-disk order,
+        so stat calls and renames that follow seek less on spinning disks.
 
         Args:
-            source: Source path
-            destination: Destination path
+            directory: Directory to scan
+
+        Returns:
+            list: os.DirEntry for each file to organize
+        """
+        # Resolve the undo log once; only an entry named like the log or like
+        # the file it links to needs its own path resolved to confirm it is the log
+        undo_log = None
+        undo_log_names = ()
+        if self.undo_manager:
+            log_file = self.undo_manager.log_file
+            undo_log = os.path.realpath(log_file)
+            undo_log_names = {os.path.basename(log_file), os.path.basename(undo_log)}
+
+        with os.scandir(directory) as entries:
+            files = [
+                entry for entry in entries
+                if entry.is_file()
+                and not (entry.name in undo_log_names and os.path.realpath(entry.path) == undo_log)
+            ]
+        # On Windows inode() costs a stat call per entry, so keep listing order
+        if os.name != 'nt':
+            files.sort(key=os.DirEntry.inode)
+        return files
+
+    def _claim_name(self, destination):
+        """
+        Pick a name that is free in the destination folder.
+
+        Each folder is listed once per run and clashes are resolved against
+        that in-memory set, remembering the next suffix to try per name,
+        rather than probing the filesystem for every candidate. The set can
+        miss files created later by other programs, so the rename itself
+        still refuses to replace an existing file.
+
+        Args:
+            destination: Desired destination path as a string
+
+        Returns:
+            str: Destination path that does not clash with an existing file
+        """
+        folder, name = os.path.split(destination)
+        used = self._used_names.get(folder)
+        if used is None:
+            used = self._used_names[folder] = {_name_key(entry) for entry in os.listdir(folder)}
+
+        if _name_key(name) in used:
+            stem, suffix = os.path.splitext(name)
+            counter = self._name_counters.get(destination, 1)
+            while _name_key(name) in used:
+                name = f"{stem}_{counter}{suffix}"
+                counter += 1
+            self._name_counters[destination] = counter
+
+        used.add(_name_key(name))
+        return os.path.join(folder, name)
+
+    def _prepare_destination(self, destination):
+        """
+        Make sure a destination folder exists and claim a free name in it.
+
+        Args:
+            destination: Desired destination path as a string
+
+        Returns:
+            str: Destination path that does not clash with an existing file
+        """
+        # A folder already listed by _claim_name this run is known to exist
+        folder = os.path.dirname(destination)
+        if folder not in self._used_names:
+            os.makedirs(folder, exist_ok=True)
+
+        # Handle duplicates
+        return self._claim_name(destination)
+
+    def _rename_claimed(self, source, destination, requested):
+        """
+        Rename a file to a claimed name, claiming another if it was taken.
+
+        Args:
+            source: Source path as a string
+            destination: Destination path claimed for the file
+            requested: Destination path originally asked for
+
+        Returns:
+            str: Path the file was moved to
+        """
+        while True:
+            try:
+                _rename(source, destination)
+                return destination
+            except FileExistsError:
+                # Created behind our back; the taken name stays claimed
+                destination = self._claim_name(requested)
+
+    def _record_move(self, source, destination):
+        """Log a completed move for undo and count it."""
+        if self.undo_manager:
+            self.undo_manager.log_operation('move', source, destination)
+        self.files_processed += 1
+
+    def _move(self, source, destination, dry_run=False):
+        """
+        Move a file given as string paths and log the operation.
+
+        Args:
+            source: Source path as a string
+            destination: Destination path as a string
             dry_run: If True, don't actually move
 
         Returns:
-            Path: Final destination path
+            str: Final destination path
         """
-        import shutil
+        if dry_run:
+            self.files_processed += 1
+            return destination
+
+        final_dest = self._rename_claimed(source, self._prepare_destination(destination), destination)
+        self._record_move(source, final_dest)
+        return final_dest
+
+    def _queue_move(self, source, destination, dry_run=False, output=None, message=None):
+        """
+        Claim a destination for a file and queue the rename.
+
+        Organize loops call this with string paths, so no Path objects are
+        built per file, and then call flush_moves() once they are done.
+        Names are claimed immediately, so queued moves never clash.
+
+        Args:
+            source: Source path as a string
+            destination: Destination path as a string
+            dry_run: If True, don't actually move
+            output: Optional OutputBuffer that reports the move
+            message: Description of the move; added to output as a
+                [MOVED] line once the file has actually been moved, or
+                right away as a [WOULD MOVE] line in a dry run
 
+        Returns:
+            str: Final destination path
+        """
         if dry_run:
             self.files_processed += 1
+            if output is not None:
+                output.add(f"[WOULD MOVE] {message}")
             return destination
 
-        destination.parent.mkdir(parents=True, exist_ok=True)
+        final_dest = self._prepare_destination(destination)
+        self._pending_moves.append((source, final_dest, destination, output, message))
+        if len(self._pending_moves) >= MOVE_BATCH_SIZE:
+            self.flush_moves()
+        return final_dest
 
-        # Handle duplicates
-        counter = 1
-        final_dest = destination
-        while final_dest.exists():
-            final_dest = destination.parent / f"{destination.stem}_{counter}{destination.suffix}"
-            counter += 1
+    def flush_moves(self):
+        """
+        Carry out queued moves and log them for undo.
 
-        shutil.move(str(source), str(final_dest))
+        Every queued move has its own source and a destination name
+        claimed for it alone, so the renames are independent and larger
+        batches run on a thread pool. A move whose name was taken by a
+        file created since the folder was listed is retried under a newly
+        claimed name. Completed moves are logged in queue order and the undo
+        log is saved, so a run that dies later can still be undone up to
+        this batch; the first failure is raised once the batch is done.
+        Each completed move is reported to the output it was queued with.
+
+        Raises:
+            Exception: The first error raised by a queued move
+        """
+        moves, self._pending_moves = self._pending_moves, []
+        renames = [(source, destination) for source, destination, *_ in moves]
+        if len(moves) >= PARALLEL_MOVE_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=min(MOVE_WORKERS, len(moves))) as executor:
+                errors = list(executor.map(_try_rename, renames))
+        else:
+            errors = [_try_rename(move) for move in renames]
+
+        first_error = None
+        for (source, destination, requested, output, message), error in zip(moves, errors):
+            if isinstance(error, FileExistsError):
+                try:
+                    destination = self._rename_claimed(source, self._claim_name(requested), requested)
+                    error = None
+                except Exception as e:
+                    error = e
+            if error is None:
+                self._record_move(source, destination)
+                if output is not None:
+                    output.add(f"[MOVED] {message}")
+            elif first_error is None:
+                first_error = error
 
         if self.undo_manager:
-            self.undo_manager.log_operation('move', source, final_dest)
+            self.undo_manager.save()
+        if first_error is not None:
+            raise first_error
 
-        self.files_processed += 1
-        return final_dest
+    def move_file(self, source, destination, dry_run=False):
+        """
+        Move a file and log the operation.
+
+        Args:
+            source: Source path
+            destination: Destination path
+            dry_run: If True, don't actually move
+
+        Returns:
+            Path: Final destination path
+        """
+        return Path(self._move(os.fspath(source), os.fspath(destination), dry_run))
@@ -1,9 +1,10 @@
 """Organize files by date strategy."""
 
+import os
+import time
 from pathlib import Path
-from datetime import datetime
 from .base import OrganizationStrategy
-from ..utils.formatter import print_separator
+from ..utils.formatter import print_separator, OutputBuffer
 
 
 class OrganizeByDate(OrganizationStrategy):
@@ -21,7 +22,7 @@ class OrganizeByDate(OrganizationStrategy):
             int: Number of files processed
         """
         directory = Path(directory)
-        self.files_processed = 0
+        self.reset()
 
         if not dry_run and self.undo_manager:
             self.undo_manager.clear()
@@ -29,24 +30,37 @@ class OrganizeByDate(OrganizationStrategy):
         print(f"\n{'[DRY RUN] ' if dry_run else ''}Organizing files by date in: {directory}")
         print_separator()
 
-        # Get the undo log file path to skip it during organization
-        undo_log_path = Path(self.undo_manager.log_file) if self.undo_manager else None
+        directory_str = os.fspath(directory)
+        # (year, month) -> (target folder, label shown in output); only a
+        # handful of months occur, so each is formatted once
+        month_folders = {}
 
-        for item in directory.iterdir():
-            if item.is_file():
-                # Skip the undo log file itself
-                if undo_log_path and item.resolve() == undo_log_path.resolve():
-                    continue
-                mod_time = datetime.fromtimestamp(item.stat().st_mtime)
-                year_folder = directory / str(mod_time.year)
-                month_folder = year_folder / f"{mod_time.month:02d}-{mod_time.strftime('%B')}"
-                target_file = month_folder / item.name
+        try:
+            with OutputBuffer() as output:
+                for entry in self.scan_files(directory):
+                    name = entry.name
+                    mod_time = time.localtime(entry.stat().st_mtime)
+                    key = (mod_time.tm_year, mod_time.tm_mon)
 
-                self.move_file(item, target_file, dry_run)
-                print(f"{'[WOULD MOVE]' if dry_run else '[MOVED]'} {item.name} → {mod_time.year}/{mod_time.month:02d}/")
+                    folder = month_folders.get(key)
+                    if folder is None:
+                        year, month = key
+                        month_folder = f"{month:02d}-{time.strftime('%B', mod_time)}"
+                        folder = month_folders[key] = (
+                            os.path.join(directory_str, str(year), month_folder),
+                            f"{year}/{month:02d}/"
+                        )
+                    target_folder, label = folder
 
-        if not dry_run and self.undo_manager:
-            self.undo_manager.save()
+                    self._queue_move(
+                        entry.path, os.path.join(target_folder, name), dry_run, output, f"{name} → {label}"
+                    )
+
+                if not dry_run:
+                    self.flush_moves()
+        finally:
+            if not dry_run and self.undo_manager:
+                self.undo_manager.save()
 
         print(f"\n✓ Processed {self.files_processed} files")
         return self.files_processed
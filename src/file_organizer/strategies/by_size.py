@@ -1,14 +1,33 @@
 """Organize files by size strategy."""
 
+import os
+from bisect import bisect_right
 from pathlib import Path
 from .base import OrganizationStrategy
-from ..config.file_types import SIZE_CATEGORIES
-from ..utils.formatter import print_separator, format_size
+from ..config.file_types import SIZE_CATEGORY_BOUNDS, SIZE_CATEGORY_UPPER_BOUNDS
+from ..utils.formatter import print_separator, format_size, OutputBuffer
 
 
 class OrganizeBySize(OrganizationStrategy):
     """Strategy to organize files by their size."""
 
+    @staticmethod
+    def get_category(size):
+        """
+        Get the size category for a file size.
+
+        Args:
+            size: File size in bytes
+
+        Returns:
+            str: Category name, or None if no category covers the size
+        """
+        index = bisect_right(SIZE_CATEGORY_UPPER_BOUNDS, size)
+        if index == len(SIZE_CATEGORY_BOUNDS):
+            return None
+        _, lower, name = SIZE_CATEGORY_BOUNDS[index]
+        return name if size >= lower else None
+
     def organize(self, directory, dry_run=False):
         """
         Organize files into size categories.
@@ -21,7 +40,7 @@ class OrganizeBySize(OrganizationStrategy):
             int: Number of files processed
         """
         directory = Path(directory)
-        self.files_processed = 0
+        self.reset()
 
         if not dry_run and self.undo_manager:
             self.undo_manager.clear()
@@ -29,33 +48,28 @@ class OrganizeBySize(OrganizationStrategy):
         print(f"\n{'[DRY RUN] ' if dry_run else ''}Organizing files by size in: {directory}")
         print_separator()
 
-        # Get the undo log file path to skip it during organization
-        undo_log_path = Path(self.undo_manager.log_file) if self.undo_manager else None
-
-        for item in directory.iterdir():
-            if item.is_file():
-                # Skip the undo log file itself
-                if undo_log_path and item.resolve() == undo_log_path.resolve():
-                    continue
+        directory_str = os.fspath(directory)
 
-                size = item.stat().st_size
+        try:
+            with OutputBuffer() as output:
+                for entry in self.scan_files(directory):
+                    name = entry.name
+                    size = entry.stat().st_size
 
-                # Determine category
-                category = None
-                for cat_name, (min_size, max_size) in SIZE_CATEGORIES.items():
-                    if min_size <= size < max_size:
-                        category = cat_name
-                        break
+                    category = self.get_category(size)
+                    if category:
+                        target_file = os.path.join(directory_str, category, name)
 
-                if category:
-                    target_dir = directory / category
-                    target_file = target_dir / item.name
+                        self._queue_move(
+                            entry.path, target_file, dry_run, output,
+                            f"{name} ({format_size(size)}) → {category}/"
+                        )
 
-                    self.move_file(item, target_file, dry_run)
-                    print(f"{'[WOULD MOVE]' if dry_run else '[MOVED]'} {item.name} ({format_size(size)}) → {category}/")
-
-        if not dry_run and self.undo_manager:
-            self.undo_manager.save()
+                if not dry_run:
+                    self.flush_moves()
+        finally:
+            if not dry_run and self.undo_manager:
+                self.undo_manager.save()
 
         print(f"\n✓ Processed {self.files_processed} files")
         return self.files_processed
@@ -1,9 +1,11 @@
 """Organize files by type strategy."""
 
+import os
 from pathlib import Path
 from .base import OrganizationStrategy
-from ..config.file_types import FILE_TYPES
-from ..utils.formatter import print_separator
+from ..config.file_types import EXTENSION_TO_CATEGORY
+from ..utils.formatter import print_separator, OutputBuffer
+from ..utils.walk import file_extension
 
 
 class OrganizeByType(OrganizationStrategy):
@@ -11,7 +13,52 @@ class OrganizeByType(OrganizationStrategy):
 
     def __init__(self, undo_manager=None, custom_rules=None):
         super().__init__(undo_manager)
-        self.custom_rules = custom_rules or {}
+        self.custom_rules = custom_rules if custom_rules is not None else {}
+
+    @property
+    def custom_rules(self):
+        """dict: Custom category -> extensions rules, checked before built-ins."""
+        return self._custom_rules
+
+    @custom_rules.setter
+    def custom_rules(self, rules):
+        self._custom_rules = rules
+        self.refresh_rules()
+
+    def refresh_rules(self):
+        """
+        Rebuild the extension lookup after the custom rules have changed.
+
+        Assigning custom_rules calls this automatically; call it directly
+        after mutating the rules dict in place.
+        """
+        self._extension_index = self._build_extension_index()
+        # Raw extension -> category, filled in lazily by get_category
+        self._category_cache = {}
+
+    def _build_extension_index(self):
+        """
+        Build a flat extension to category lookup table.
+
+        Custom rules are indexed before built-in types so they take
+        precedence; within each, the first category listing an extension wins.
+        Without custom rules the module-level built-in table is shared
+        rather than copied; it must not be modified.
+
+        Returns:
+            dict: Mapping of extension to category name
+        """
+        custom_index = {}
+        for category, extensions in self.custom_rules.items():
+            for extension in extensions:
+                custom_index.setdefault(extension, category)
+
+        if not custom_index:
+            return EXTENSION_TO_CATEGORY
+
+        index = dict(EXTENSION_TO_CATEGORY)
+        index.update(custom_index)
+        return index
 
     def get_category(self, extension):
         """
@@ -23,22 +70,23 @@ class OrganizeByType(OrganizationStrategy):
         Returns:
             str: Category name
         """
+        category = self._category_cache.get(extension)
+        if category is None:
+            category = self._category_cache[extension] = self._lookup_category(extension)
+        return category
+
+    def _lookup_category(self, extension):
+        """Resolve an extension's category without consulting the cache."""
         extension = extension.lower()
 
-        # Check custom rules first
-        for category, extensions in self.custom_rules.items():
-            if extension in extensions:
-                return category
+        category = self._extension_index.get(extension)
+        if category is not None:
+            return category
 
         # Handle special compound extensions
         if 'postman_collection' in extension:
             return 'Config'
 
-        # Check built-in file types
-        for category, extensions in FILE_TYPES.items():
-            if extension in extensions:
-                return category
-
         return 'Other'
 
     def organize(self, directory, dry_run=False):
@@ -53,7 +101,7 @@ class OrganizeByType(OrganizationStrategy):
             int: Number of files processed
         """
         directory = Path(directory)
-        self.files_processed = 0
+        self.reset()
 
         if not dry_run and self.undo_manager:
             self.undo_manager.clear()
@@ -61,24 +109,22 @@ class OrganizeByType(OrganizationStrategy):
         print(f"\n{'[DRY RUN] ' if dry_run else ''}Organizing files by type in: {directory}")
         print_separator()
 
-        # Get the undo log file path to skip it during organization
-        undo_log_path = Path(self.undo_manager.log_file) if self.undo_manager else None
+        directory_str = os.fspath(directory)
 
-        for item in directory.iterdir():
-            if item.is_file():
-                # Skip the undo log file itself
-                if undo_log_path and item.resolve() == undo_log_path.resolve():
-                    continue
+        try:
+            with OutputBuffer() as output:
+                for entry in self.scan_files(directory):
+                    name = entry.name
+                    category = self.get_category(file_extension(name))
+                    target_file = os.path.join(directory_str, category, name)
 
-                category = self.get_category(item.suffix)
-                target_dir = directory / category
-                target_file = target_dir / item.name
+                    self._queue_move(entry.path, target_file, dry_run, output, f"{name} → {category}/")
 
-                self.move_file(item, target_file, dry_run)
-                print(f"{'[WOULD MOVE]' if dry_run else '[MOVED]'} {item.name} → {category}/")
-
-        if not dry_run and self.undo_manager:
-            self.undo_manager.save()
+                if not dry_run:
+                    self.flush_moves()
+        finally:
+            if not dry_run and self.undo_manager:
+                self.undo_manager.save()
 
         print(f"\n✓ Processed {self.files_processed} files")
         return self.files_processed
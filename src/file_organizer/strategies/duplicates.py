@@ -1,66 +1,353 @@
 """Find and manage duplicate files."""
 
+import os
 from pathlib import Path
-from collections import defaultdict
-from ..utils.file_hash import get_file_hash
-from ..utils.formatter import print_separator, format_size
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import repeat
+from ..config.settings import (
+    DELETE_OPEN_DIRS,
+    DUPLICATE_BATCH_FILES,
+    DUPLICATE_HASH_ALGORITHM,
+    HASH_PREFIX_SIZE,
+    HASH_WORKERS,
+    PARALLEL_HASH_MIN_FILES
+)
+from ..utils.file_hash import get_file_hash, get_file_head_hash
+from ..utils.formatter import print_separator, format_size, OutputBuffer
+from ..utils.walk import iter_files_parallel
+
+# Duplicates are unlinked relative to an open descriptor of their folder
+# where supported, so the kernel doesn't walk the full path for each one
+_FD_UNLINK = os.unlink in os.supports_dir_fd and hasattr(os, 'O_DIRECTORY')
+
+
+def _disk_order(candidate):
+    """
+    Sort key placing a (group id, entry) candidate in on-disk order.
+
+    Inode numbers roughly follow where files are stored on most
+    filesystems, so reading in (device, inode) order cuts seeking. The stat
+    result is the one cached by the size pass, so no syscall is made.
+    """
+    stat = candidate[1].stat()
+    return stat.st_dev, stat.st_ino
 
 
 class DuplicateFinder:
     """Find and optionally remove duplicate files."""
 
-    def __init__(self):
+    def __init__(self, hash_cache=None):
+        """
+        Initialize the finder.
+
+        Args:
+            hash_cache: Optional HashCache used to reuse full-content hashes
+                of unchanged files from earlier scans
+        """
+        self.hash_cache = hash_cache
         self.duplicates_found = 0
         self.space_saved = 0
 
-    def find_duplicates(self, directory, delete=False):
+    @staticmethod
+    def _refine_groups(groups, hash_func, map_func=map):
+        """
+        Split candidate groups into sub-groups of files sharing a hash.
+
+        Files from all groups are hashed through a single map call, so with
+        an executor's map reads overlap no matter how candidates are spread
+        across groups. Files are read in on-disk order rather than the
+        order the walk found them.
+
+        Args:
+            groups: (size, entries) pairs of os.DirEntry objects for files
+                that may be duplicates
+            hash_func: Function taking (path, algorithm) and returning a digest
+            map_func: map-like callable used to hash the files, e.g. the
+                built-in map or an executor's map
+
+        Returns:
+            list: (size, files) pairs of two or more files with matching hashes
+        """
+        candidates = [(group_id, file) for group_id, (_, group) in enumerate(groups) for file in group]
+        candidates.sort(key=_disk_order)
+        files = [file for _, file in candidates]
+        hashes = map_func(hash_func, files, repeat(DUPLICATE_HASH_ALGORITHM))
+
+        refined = defaultdict(list)
+        for (group_id, file), file_hash in zip(candidates, hashes):
+            if file_hash:
+                refined[(group_id, file_hash)].append(file)
+        return [
+            (groups[group_id][0], group)
+            for (group_id, _), group in refined.items()
+            if len(group) > 1
+        ]
+
+    def _map_with_cache(self, map_func, hash_func, files, algorithms, read_cache=True):
+        """
+        map-like wrapper that serves hashes from the hash cache.
+
+        Only files without an up-to-date cached hash are passed on to
+        map_func, and their new hashes are saved back to the cache.
+
+        Args:
+            map_func: map-like callable used to hash cache misses
+            hash_func: Function taking (path, algorithm) and returning a digest
+            files: os.DirEntry objects to hash
+            algorithms: Iterable of algorithm names passed to hash_func
+            read_cache: If False, every file is hashed again and the cache
+                is only refreshed with the new digests
+
+        Returns:
+            list: Digest for each file, in order
+        """
+        stats = [file.stat() for file in files]
+        if read_cache:
+            digests = [self.hash_cache.get(stat, DUPLICATE_HASH_ALGORITHM) for stat in stats]
+        else:
+            digests = [None] * len(files)
+        misses = [index for index, digest in enumerate(digests) if digest is None]
+
+        computed = map_func(hash_func, [files[index] for index in misses], algorithms)
+        for index, digest in zip(misses, computed):
+            digests[index] = digest
+
+        self.hash_cache.put_many(
+            ((stats[index], digests[index]) for index in misses),
+            DUPLICATE_HASH_ALGORITHM
+        )
+        return digests
+
+    def _hash_candidates(self, short_groups, long_groups, map_func, read_cache=True):
+        """
+        Run the hashing stages over groups of same-size files.
+
+        Args:
+            short_groups: Groups whose files fit within the hashed prefix
+            long_groups: Groups whose files are longer than the prefix
+            map_func: map-like callable used to hash the files
+            read_cache: Whether cached full hashes may be used
+
+        Returns:
+            list: (size, files) pairs of two or more files with identical content
+        """
+        full_hash_map = map_func
+        if self.hash_cache is not None:
+            full_hash_map = partial(self._map_with_cache, map_func, read_cache=read_cache)
+
+        candidate_groups = self._refine_groups(short_groups, get_file_head_hash, map_func)
+        long_groups = self._refine_groups(long_groups, get_file_head_hash, map_func)
+        candidate_groups += self._refine_groups(long_groups, get_file_hash, full_hash_map)
+        return candidate_groups
+
+    def _confirm_batch(self, groups, map_func, read_cache=True):
+        """
+        Hash a batch of same-size groups and yield the confirmed duplicates.
+
+        Args:
+            groups: (size, entries) pairs of files sharing a size
+            map_func: map-like callable used to hash the files
+            read_cache: Whether cached full hashes may be used
+
+        Yields:
+            tuple: (file size, list of Path) for each group of identical files
+        """
+        # Hard links to one inode are identical without reading them, so
+        # only the first link found is hashed; (device, inode) -> all links
+        links = {}
+        # A file no longer than the prefix is hashed in full by the first
+        # stage, so its groups need no second read
+        short_groups = []
+        long_groups = []
+        for size, files in groups:
+            unique = []
+            for entry in files:
+                stat = entry.stat()
+                # Windows scandir reports inode 0, which identifies nothing
+                if stat.st_ino:
+                    key = (stat.st_dev, stat.st_ino)
+                    same_inode = links.get(key)
+                    if same_inode is not None:
+                        same_inode.append(entry)
+                        continue
+                    links[key] = [entry]
+                unique.append(entry)
+            if len(unique) > 1:
+                (short_groups if size <= HASH_PREFIX_SIZE else long_groups).append((size, unique))
+
+        for size, files in self._hash_candidates(short_groups, long_groups, map_func, read_cache):
+            group = []
+            for entry in files:
+                stat = entry.stat()
+                group += links.pop((stat.st_dev, stat.st_ino), None) or [entry]
+            yield size, self._sorted_paths(group)
+
+        # Links whose content matched no other file are still duplicates of each other
+        for same_inode in links.values():
+            if len(same_inode) > 1:
+                yield same_inode[0].stat().st_size, self._sorted_paths(same_inode)
+
+    def _confirm_in_batches(self, groups, map_func, read_cache=True):
+        """
+        Confirm duplicates batch by batch, releasing each batch when done.
+
+        Args:
+            groups: deque of (size, entries) pairs; consumed as it is read
+            map_func: map-like callable used to hash the files
+            read_cache: Whether cached full hashes may be used
+
+        Yields:
+            tuple: (file size, list of Path) for each group of identical files
+        """
+        while groups:
+            batch = []
+            batch_files = 0
+            while groups and batch_files < DUPLICATE_BATCH_FILES:
+                size, files = groups.popleft()
+                batch.append((size, files))
+                batch_files += len(files)
+            yield from self._confirm_batch(batch, map_func, read_cache)
+
+    @staticmethod
+    def _unlink(path, dir_fds):
+        """
+        Delete a file, relative to its folder's descriptor where supported.
+
+        Args:
+            path: Path of the file to delete
+            dir_fds: Folder -> open descriptor cache shared across calls;
+                the caller closes the descriptors when done
+        """
+        if not _FD_UNLINK:
+            os.unlink(path)
+            return
+
+        folder, name = os.path.split(os.fspath(path))
+        fd = dir_fds.get(folder)
+        if fd is None:
+            if len(dir_fds) >= DELETE_OPEN_DIRS:
+                for open_fd in dir_fds.values():
+                    os.close(open_fd)
+                dir_fds.clear()
+            fd = dir_fds[folder] = os.open(folder, os.O_RDONLY | os.O_DIRECTORY)
+        os.unlink(name, dir_fd=fd)
+
+    @staticmethod
+    def _sorted_paths(entries):
+        """
+        Order a duplicate group so the file to keep comes first.
+
+        Files are sorted reverse alphabetically by path for deterministic
+        results; this keeps files without "duplicate" in the name. The
+        walk's path strings are sorted directly, so Paths are only built
+        for the result.
+        """
+        return [Path(path) for path in sorted((entry.path for entry in entries), reverse=True)]
+
+    def iter_duplicates(self, directory, workers=None, read_cache=True):
+        """
+        Yield groups of duplicate files as they are confirmed.
+
+        Candidates are narrowed in stages so that only files which could
+        still be duplicates are read in full: first by size, then by a hash
+        of their leading bytes, and finally by a hash of their whole content.
+        Hard links to the same inode are hashed only once.
+        Same-size files are hashed in batches of about DUPLICATE_BATCH_FILES,
+        so groups are yielded as each batch finishes and only one batch's
+        hashes are held at a time.
+
+        Args:
+            directory: Directory to scan
+            workers: Threads used to walk the tree and hash files; defaults
+                to HASH_WORKERS. With workers=1 everything runs on the
+                calling thread, and small scans always hash there.
+            read_cache: Whether full hashes may be served from the hash
+                cache. Pass False when the result decides what to delete,
+                so every match is confirmed against the current contents.
+
+        Yields:
+            tuple: (file size, list of Path) for each group of identical
+                files, with the file to keep first
+        """
+        workers = HASH_WORKERS if workers is None else workers
+
+        # Group by size - a file with a unique size cannot have a duplicate
+        files_by_size = defaultdict(list)
+        # Links are left out: deleting a link's target as a "duplicate"
+        # of the link would leave the link dangling
+        for entry in iter_files_parallel(directory, workers, include_symlinks=False):
+            files_by_size[entry.stat().st_size].append(entry)
+
+        # Empty files are all identical and are not read at all
+        empty_files = files_by_size.pop(0, [])
+        groups = deque(
+            (size, files) for size, files in files_by_size.items() if len(files) > 1
+        )
+        del files_by_size
+
+        if len(empty_files) > 1:
+            yield 0, self._sorted_paths(empty_files)
+
+        candidate_count = sum(len(files) for _, files in groups)
+        if workers > 1 and candidate_count >= PARALLEL_HASH_MIN_FILES:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                yield from self._confirm_in_batches(groups, executor.map, read_cache)
+        else:
+            yield from self._confirm_in_batches(groups, map, read_cache)
+
+    def find_duplicates(self, directory, delete=False, workers=None):
         """
         Find duplicate files based on content hash.
 
+        Groups are reported, and deleted if requested, as iter_duplicates
+        confirms them. When deleting, cached hashes are not trusted and
+        every candidate is read again.
+
         Args:
             directory: Directory to scan
             delete: If True, delete duplicates (keep first occurrence)
+            workers: Threads used to walk the tree and hash files; defaults
+                to HASH_WORKERS. With workers=1 everything runs on the
+                calling thread, and small scans always hash there.
 
         Returns:
             list: List of duplicate file groups
         """
         directory = Path(directory)
-        file_hashes = defaultdict(list)
         duplicates = []
         total_size = 0
+        # Every path starts with the scanned directory, so slicing it off
+        # gives the relative path without a relative_to() call per file
+        prefix_length = len(os.path.join(str(directory), ''))
 
         print(f"\n{'[DELETE MODE] ' if delete else ''}Finding duplicates in: {directory}")
         print_separator()
         print("Scanning files...")
 
-        # Build hash map
-        for item in directory.rglob('*'):
-            if item.is_file():
-                file_hash = get_file_hash(item)
-                if file_hash:
-                    file_hashes[file_hash].append(item)
-
-        # Find duplicates
-        for file_hash, files in file_hashes.items():
-            if len(files) > 1:
-                # Sort files to ensure deterministic behavior (reverse alphabetically by name)
-                # This ensures files without "duplicate" in the name are kept
-                files = sorted(files, key=lambda f: str(f), reverse=True)
-                duplicates.append(files)
-                file_size = files[0].stat().st_size
-                duplicate_size = file_size * (len(files) - 1)
-                total_size += duplicate_size
-
-                print(f"\n🔄 Found {len(files)} duplicates ({format_size(file_size)} each):")
-                for i, file in enumerate(files):
-                    status = "[ORIGINAL]" if i == 0 else "[DUPLICATE]"
-                    print(f"  {status} {file.relative_to(directory)}")
-
-                    if delete and i > 0:  # Keep first, delete rest
-                        file.unlink()
-                        print(f"    ✗ Deleted")
-                        self.duplicates_found += 1
-                        self.space_saved += file_size
+        # Folder -> open descriptor, reused for every deletion in that folder
+        dir_fds = {}
+        try:
+            with OutputBuffer() as output:
+                for file_size, files in self.iter_duplicates(directory, workers, read_cache=not delete):
+                    duplicates.append(files)
+                    duplicate_size = file_size * (len(files) - 1)
+                    total_size += duplicate_size
+
+                    output.add(f"\n🔄 Found {len(files)} duplicates ({format_size(file_size)} each):")
+                    for i, file in enumerate(files):
+                        status = "[ORIGINAL]" if i == 0 else "[DUPLICATE]"
+                        output.add(f"  {status} {str(file)[prefix_length:]}")
+
+                        if delete and i > 0:  # Keep first, delete rest
+                            self._unlink(file, dir_fds)
+                            output.add(f"    ✗ Deleted")
+                            self.duplicates_found += 1
+                            self.space_saved += file_size
+        finally:
+            for fd in dir_fds.values():
+                os.close(fd)
 
         print_separator()
         print(f"Total duplicate sets: {len(duplicates)}")
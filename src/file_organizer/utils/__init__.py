@@ -1,7 +1,22 @@
 """Utility modules."""
 
-from .file_hash import get_file_hash
-from .formatter import format_size, print_separator, print_header
+from .file_hash import get_file_hash, get_file_hashes, get_file_head_hash
+from .formatter import format_size, print_separator, print_header, OutputBuffer
+from .hash_cache import HashCache
 from .undo_manager import UndoManager
+from .walk import file_extension, iter_files, iter_files_parallel
 
-__all__ = ['get_file_hash', 'format_size', 'print_separator', 'print_header', 'UndoManager']
+__all__ = [
+    'get_file_hash',
+    'get_file_hashes',
+    'get_file_head_hash',
+    'format_size',
+    'print_separator',
+    'print_header',
+    'OutputBuffer',
+    'HashCache',
+    'UndoManager',
+    'file_extension',
+    'iter_files',
+    'iter_files_parallel'
+]
@@ -1,25 +1,306 @@
 """File hashing utilities."""
 
+import errno
 import hashlib
-from ..config.settings import HASH_CHUNK_SIZE
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from ..config.settings import (
+    DIRECT_IO_THRESHOLD,
+    HASH_CHUNK_SIZE,
+    HASH_PREFIX_SIZE,
+    HASH_WORKERS
+)
 
+try:
+    import fcntl
+except ImportError:  # Not available on Windows, which has no O_DIRECT either
+    fcntl = None
 
-def get_file_hash(filepath, algorithm='md5'):
+try:
+    import xxhash
+except ImportError:  # Optional; only needed for the xxh3_128 algorithm
+    xxhash = None
+
+try:
+    import blake3
+except ImportError:  # Optional; only needed for the blake3 algorithm
+    blake3 = None
+
+# Per-thread read buffers, reused across files to avoid a fresh allocation per chunk
+_thread_local = threading.local()
+
+# Pristine hash objects per algorithm; copying one is cheaper than
+# constructing a new object by name. Templates are never updated, so they
+# can be copied from any thread.
+_hash_templates = {}
+
+
+def _new_hash(algorithm):
+    """
+    Create a hash object for an algorithm name.
+
+    Accepts every hashlib algorithm plus 'xxh3_128', a non-cryptographic
+    hash several times faster than BLAKE2, when the optional xxhash
+    package is installed, and 'blake3' when the optional blake3 package
+    is installed. The first object made for an algorithm is kept
+    as a template and later ones are copied from it.
+
+    Args:
+        algorithm: Hash algorithm name
+
+    Returns:
+        Hash object with update() and hexdigest()
+
+    Raises:
+        ValueError: If the algorithm is not available
+    """
+    template = _hash_templates.get(algorithm)
+    if template is None:
+        if algorithm == 'xxh3_128':
+            if xxhash is None:
+                raise ValueError("xxh3_128 requires the optional xxhash package")
+            template = xxhash.xxh3_128()
+        elif algorithm == 'blake3':
+            if blake3 is None:
+                raise ValueError("blake3 requires the optional blake3 package")
+            template = blake3.blake3()
+        else:
+            template = hashlib.new(algorithm)
+        template = _hash_templates.setdefault(algorithm, template)
+    return template.copy()
+
+
+def _get_read_buffer(size):
+    """
+    Get the calling thread's reusable read buffer.
+
+    The buffer only grows, so it is reallocated at most a handful of times
+    per thread.
+
+    Args:
+        size: Minimum buffer size in bytes
+
+    Returns:
+        bytearray: Buffer of at least size bytes
+    """
+    buffer = getattr(_thread_local, 'buffer', None)
+    if buffer is None or len(buffer) < size:
+        buffer = _thread_local.buffer = bytearray(size)
+    return buffer
+
+
+def _get_direct_buffer():
+    """
+    Get the calling thread's page-aligned buffer for O_DIRECT reads.
+
+    Anonymous memory maps are always page aligned, which O_DIRECT
+    requires of the destination buffer.
+
+    Returns:
+        mmap.mmap: Buffer of HASH_CHUNK_SIZE bytes
+    """
+    buffer = getattr(_thread_local, 'direct_buffer', None)
+    if buffer is None:
+        buffer = _thread_local.direct_buffer = mmap.mmap(-1, HASH_CHUNK_SIZE)
+    return buffer
+
+
+def _read_chunk_size(stat):
+    """
+    Choose the read size for a file.
+
+    Uses the filesystem's preferred I/O block size when it exceeds
+    HASH_CHUNK_SIZE, so reads stay aligned with how the file is stored.
+
+    Args:
+        stat: os.stat_result of the open file
+
+    Returns:
+        int: Number of bytes to request per read
+    """
+    block_size = getattr(stat, 'st_blksize', 0)
+    return max(block_size, HASH_CHUNK_SIZE)
+
+
+def _advise_sequential(fd):
+    """
+    Hint the kernel that a file will be read sequentially from start to end.
+
+    This enables more aggressive readahead where supported (POSIX only);
+    failures are ignored since the hint is purely advisory.
+
+    Args:
+        fd: Open file descriptor
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def _hash_mapped(fd, hash_obj):
+    """
+    Feed a whole file to a hash object through a memory map.
+
+    The hash consumes the mapping in one update() call, without a Python
+    level read loop or copies into a read buffer.
+
+    Args:
+        fd: Open file descriptor
+        hash_obj: Hash object to update
+
+    Returns:
+        bool: True if the file was hashed, False if it cannot be mapped
+    """
+    try:
+        mapped = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):  # Empty files, pipes and some pseudo-files
+        return False
+
+    with mapped:
+        if hasattr(mapped, 'madvise'):
+            mapped.madvise(mmap.MADV_SEQUENTIAL)
+        hash_obj.update(mapped)
+    return True
+
+
+def _hash_direct(fd, hash_obj):
+    """
+    Feed an open file to a hash object using O_DIRECT reads.
+
+    O_DIRECT is switched on for the descriptor already open, so the file
+    that was stat'ed is the one read, and switched off again afterwards.
+    Reads bypass the page cache, so hashing a file far larger than memory
+    does not evict data other work is still using.
+
+    Args:
+        fd: Open file descriptor positioned at the start of the file
+        hash_obj: Hash object to update
+
+    Returns:
+        bool: True if the file was hashed, False if O_DIRECT is not
+            supported here and nothing was read
+    """
+    direct_flag = getattr(os, 'O_DIRECT', 0)
+    if not direct_flag or fcntl is None:
+        return False
+    try:
+        flags = fcntl.fcntl(fd, fcntl.F_GETFL)
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags | direct_flag)
+    except OSError:
+        return False
+
+    try:
+        buffer = _get_direct_buffer()
+        try:
+            bytes_read = os.readv(fd, [buffer])
+        except OSError as e:
+            # Filesystems without O_DIRECT support reject the first read
+            if e.errno == errno.EINVAL:
+                return False
+            raise
+        with memoryview(buffer) as view:
+            while bytes_read:
+                hash_obj.update(view[:bytes_read])
+                bytes_read = os.readv(fd, [buffer])
+        return True
+    finally:
+        fcntl.fcntl(fd, fcntl.F_SETFL, flags)
+
+
+def get_file_hash(filepath, algorithm='sha256', use_mmap=False):
     """
     Calculate hash of a file.
 
+    Files of DIRECT_IO_THRESHOLD bytes or more are read with O_DIRECT
+    where the platform and filesystem support it.
+
     Args:
         filepath: Path to the file
-        algorithm: Hash algorithm to use (md5, sha256, etc.)
+        algorithm: Hash algorithm to use (sha256, blake2b, blake3, xxh3_128, etc.)
+        use_mmap: If True, hash the file through a memory map in a single
+            update() call. Only use this for files that will not be
+            truncated while they are hashed, since reading a page past
+            the new end of a mapped file kills the process with SIGBUS.
+            Files that cannot be mapped are read normally.
 
     Returns:
         str: Hex digest of the file hash, or None if error
     """
-    hash_obj = hashlib.new(algorithm)
+    hash_obj = _new_hash(algorithm)
+    try:
+        with open(filepath, "rb", buffering=0) as f:
+            fd = f.fileno()
+            if use_mmap and _hash_mapped(fd, hash_obj):
+                return hash_obj.hexdigest()
+            stat = os.fstat(fd)
+            if stat.st_size >= DIRECT_IO_THRESHOLD and _hash_direct(fd, hash_obj):
+                return hash_obj.hexdigest()
+            _advise_sequential(fd)
+            buffer = _get_read_buffer(_read_chunk_size(stat))
+            with memoryview(buffer) as view:
+                while bytes_read := f.readinto(buffer):
+                    hash_obj.update(view[:bytes_read])
+        return hash_obj.hexdigest()
+    except Exception:
+        return None
+
+
+def get_file_hashes(paths, algorithm='sha256', workers=None):
+    """
+    Calculate hashes of several files concurrently.
+
+    Files are hashed on a thread pool; hashlib releases the GIL while
+    digesting large buffers and reads release it too, so threads keep
+    several reads in flight without the start-up and pickling cost of
+    worker processes.
+
+    Args:
+        paths: Iterable of file paths
+        algorithm: Hash algorithm to use (sha256, blake2b, blake3, xxh3_128, etc.)
+        workers: Number of hashing threads; defaults to HASH_WORKERS.
+            With workers=1 every file is hashed on the calling thread.
+
+    Returns:
+        list: Hex digest per path in input order, None where hashing failed
+
+    Raises:
+        ValueError: If the algorithm is not available
+    """
+    paths = list(paths)
+    workers = HASH_WORKERS if workers is None else workers
+    _new_hash(algorithm)  # Fail fast on an unknown algorithm
+    hash_file = partial(get_file_hash, algorithm=algorithm)
+
+    if workers <= 1 or len(paths) <= 1:
+        return list(map(hash_file, paths))
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(executor.map(hash_file, paths))
+
+
+def get_file_head_hash(filepath, algorithm='sha256', length=HASH_PREFIX_SIZE):
+    """
+    Calculate hash of the first bytes of a file.
+
+    Used as a cheap pre-filter: files whose leading bytes differ cannot
+    be duplicates, so they never need a full read.
+
+    Args:
+        filepath: Path to the file
+        algorithm: Hash algorithm to use (sha256, blake2b, blake3, xxh3_128, etc.)
+        length: Number of leading bytes to hash
+
+    Returns:
+        str: Hex digest of the leading bytes, or None if error
+    """
+    hash_obj = _new_hash(algorithm)
     try:
         with open(filepath, "rb") as f:
-            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
-                hash_obj.update(chunk)
+            hash_obj.update(f.read(length))
         return hash_obj.hexdigest()
     except Exception:
         return None
@@ -1,5 +1,11 @@
 """Output formatting utilities."""
 
+import sys
+from functools import lru_cache
+from ..config.settings import OUTPUT_FLUSH_LINES
+
+SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
 
 def format_size(size):
     """
@@ -11,20 +17,63 @@ def format_size(size):
     Returns:
         str: Formatted size string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size < 1024.0:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-    return f"{size:.2f} PB"
+    if size < 1024:
+        return f"{size:.2f} B"
+    # Each unit spans 10 bits, so the magnitude falls out of bit_length()
+    index = min((int(size).bit_length() - 1) // 10, len(SIZE_UNITS) - 1)
+    return f"{size / (1 << (10 * index)):.2f} {SIZE_UNITS[index]}"
+
+
+@lru_cache(maxsize=64)
+def _rule(char, length):
+    """Build a horizontal rule; reports reuse a handful of them many times."""
+    return char * length
 
 
 def print_separator(char='─', length=70):
     """Print a separator line."""
-    print(char * length)
+    print(_rule(char, length))
 
 
 def print_header(text, char='='):
     """Print a formatted header."""
-    print(f"\n{char * 70}")
-    print(f"  {text}")
-    print(f"{char * 70}")
+    rule = _rule(char, 70)
+    print(f"\n{rule}\n  {text}\n{rule}")
+
+
+class OutputBuffer:
+    """Collect output lines and write them to stdout in batches."""
+
+    def __init__(self, flush_every=OUTPUT_FLUSH_LINES):
+        """
+        Initialize buffer.
+
+        Args:
+            flush_every: Number of queued lines that triggers a write
+        """
+        self.flush_every = flush_every
+        self.lines = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.flush()
+
+    def add(self, line):
+        """
+        Queue a line for output.
+
+        Args:
+            line: Text to write, without a trailing newline
+        """
+        self.lines.append(line)
+        if len(self.lines) >= self.flush_every:
+            self.flush()
+
+    def flush(self):
+        """Write all queued lines to stdout in a single call."""
+        if self.lines:
+            self.lines.append('')
+            sys.stdout.write('\n'.join(self.lines))
+            self.lines.clear()
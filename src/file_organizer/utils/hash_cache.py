@@ -0,0 +1,128 @@
+"""Persistent cache of file content hashes."""
+
+import sqlite3
+from ..config.settings import HASH_CACHE_FILE, HASH_CACHE_BATCH_SIZE
+
+
+class HashCache:
+    """
+    Remember file hashes between runs.
+
+    Entries are keyed by device and inode and are only trusted while the
+    file's size, modification time and change time are unchanged, so an
+    edited file is always hashed again. The change time is checked as
+    well because tools like ``cp -p`` and ``touch -r`` set the modification
+    time back after rewriting a file, while the change time cannot be set
+    from userspace. If the cache file cannot be opened or written the
+    cache disables itself and every lookup misses.
+    """
+
+    # Bumped whenever the table layout changes; older tables are dropped
+    SCHEMA_VERSION = 1
+
+    def __init__(self, cache_file=None):
+        self.cache_file = cache_file or HASH_CACHE_FILE
+        self._connection = None
+        self._disabled = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _connect(self):
+        """
+        Open the cache database on first use.
+
+        Returns:
+            sqlite3.Connection: Open connection, or None if unavailable
+        """
+        if self._connection is None and not self._disabled:
+            try:
+                connection = sqlite3.connect(str(self.cache_file))
+                version = connection.execute("PRAGMA user_version").fetchone()[0]
+                if version != self.SCHEMA_VERSION:
+                    with connection:
+                        connection.execute("DROP TABLE IF EXISTS hashes")
+                        connection.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS hashes ("
+                    "dev INTEGER, ino INTEGER, algorithm TEXT, "
+                    "size INTEGER, mtime_ns INTEGER, ctime_ns INTEGER, digest TEXT, "
+                    "PRIMARY KEY (dev, ino, algorithm))"
+                )
+                self._connection = connection
+            except sqlite3.Error:
+                self._disabled = True
+        return self._connection
+
+    @staticmethod
+    def _cacheable(stat):
+        """Whether a stat result identifies its file (Windows scandir reports inode 0)."""
+        return stat.st_ino != 0
+
+    def get(self, stat, algorithm):
+        """
+        Look up the cached hash of a file.
+
+        Args:
+            stat: os.stat_result of the file
+            algorithm: Hash algorithm the digest was computed with
+
+        Returns:
+            str: Cached hex digest, or None if missing or out of date
+        """
+        connection = self._connect()
+        if connection is None or not self._cacheable(stat):
+            return None
+
+        try:
+            row = connection.execute(
+                "SELECT size, mtime_ns, ctime_ns, digest FROM hashes "
+                "WHERE dev = ? AND ino = ? AND algorithm = ?",
+                (stat.st_dev, stat.st_ino, algorithm)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None or row[:3] != (stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns):
+            return None
+        return row[3]
+
+    def put_many(self, entries, algorithm):
+        """
+        Store hashes for several files.
+
+        Rows are written with executemany in batches of
+        HASH_CACHE_BATCH_SIZE, each committed as one transaction.
+
+        Args:
+            entries: Iterable of (os.stat_result, digest) pairs
+            algorithm: Hash algorithm the digests were computed with
+        """
+        connection = self._connect()
+        if connection is None:
+            return
+
+        rows = [
+            (stat.st_dev, stat.st_ino, algorithm,
+             stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, digest)
+            for stat, digest in entries
+            if digest and self._cacheable(stat)
+        ]
+        try:
+            for start in range(0, len(rows), HASH_CACHE_BATCH_SIZE):
+                with connection:
+                    connection.executemany(
+                        "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows[start:start + HASH_CACHE_BATCH_SIZE]
+                    )
+        except sqlite3.Error:
+            self._disabled = True
+
+    def close(self):
+        """Close the cache database."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
@@ -1,9 +1,105 @@
 """Undo operation management."""
 
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from ..config.settings import UNDO_LOG_FILE
+from ..config.settings import (
+    UNDO_LOG_FILE,
+    UNDO_LOG_FSYNC,
+    UNDO_READ_BLOCK_SIZE,
+    UNDO_WORKERS,
+    UNDO_BATCH_SIZE
+)
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; the standard library is used otherwise
+    orjson = None
+
+
+def _dump_line(operation):
+    """
+    Serialize an operation as a single JSON line.
+
+    Args:
+        operation: Operation dict
+
+    Returns:
+        str: Compact JSON followed by a newline
+    """
+    if orjson is not None:
+        return orjson.dumps(operation).decode() + '\n'
+    return json.dumps(operation, separators=(',', ':')) + '\n'
+
+
+def _load_line(line):
+    """
+    Parse a single JSON line.
+
+    Args:
+        line: Line from the undo log
+
+    Returns:
+        dict: Operation
+    """
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _sync_directory(directory):
+    """
+    Flush a directory to disk so a file renamed into it survives a crash.
+
+    Windows cannot open a directory for syncing, so nothing is done there.
+
+    Args:
+        directory: Directory path
+    """
+    if os.name == 'nt':
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _restore(move):
+    """
+    Move a file back to its original location.
+
+    Args:
+        move: (source, destination) Path pair from the log, or the
+            exception raised while reading an unusable log entry
+
+    Returns:
+        tuple: (move, outcome); outcome is 'restored', 'missing' if the
+            moved file no longer exists, or the exception that occurred
+    """
+    if isinstance(move, Exception):
+        return move, move
+
+    source, dest = move
+    try:
+        if not dest.exists():
+            return move, 'missing'
+        dest.rename(source)
+        return move, 'restored'
+    except Exception as e:
+        return move, e
+
+
+def _confirm_undo():
+    """
+    Ask on stdin whether to undo the last session.
+
+    Returns:
+        bool: True if the user answered yes
+    """
+    return input("\nUndo all operations from last session? (y/n): ").lower() == 'y'
 
 
 class UndoManager:
@@ -12,6 +108,9 @@ class UndoManager:
     def __init__(self, log_file=None):
         self.log_file = log_file or UNDO_LOG_FILE
         self.operations = []
+        # Number of operations already written to the log file, or None if
+        # the file has not been synced with this manager yet
+        self._saved_count = None
 
     def log_operation(self, operation_type, source, destination):
         """
@@ -29,11 +128,43 @@ class UndoManager:
             'timestamp': datetime.now().isoformat()
         })
 
-    def save(self):
-        """Save undo log to file."""
+    def save(self, fsync=None):
+        """
+        Save undo log to file.
+
+        The log is stored as JSON Lines, one operation per line. Once the
+        file is in sync with this manager, only operations logged since the
+        last save are appended, so saving after every move stays cheap.
+        A full rewrite goes to a temporary file that then replaces the log,
+        so readers never see a half-written log. When syncing, the log is
+        fsynced once per save, so a whole batch of moves becomes durable
+        together, and after a rewrite the folder holding it is synced too
+        so the replacement itself is on disk.
+
+        Args:
+            fsync: Whether to wait for the log to reach the disk; defaults
+                to UNDO_LOG_FSYNC
+        """
+        if fsync is None:
+            fsync = UNDO_LOG_FSYNC
+
+        rewrite = self._saved_count is None
+        if rewrite:
+            path, mode, pending = f"{os.fspath(self.log_file)}.tmp", 'w', self.operations
+        else:
+            path, mode, pending = self.log_file, 'a', self.operations[self._saved_count:]
+
         try:
-            with open(self.log_file, 'w') as f:
-                json.dump(self.operations, f, indent=2)
+            with open(path, mode) as f:
+                f.writelines(_dump_line(op) for op in pending)
+                f.flush()
+                if fsync:
+                    os.fsync(f.fileno())
+            if rewrite:
+                os.replace(path, self.log_file)
+                if fsync:
+                    _sync_directory(os.path.dirname(os.path.abspath(self.log_file)))
+            self._saved_count = len(self.operations)
         except Exception as e:
             print(f"Warning: Could not save undo log: {e}")
 
@@ -41,33 +172,153 @@ class UndoManager:
         """
         Load undo log from file.
 
+        Reads the JSON Lines format, and also accepts logs written as a
+        single JSON array by earlier versions.
+
         Returns:
             bool: True if loaded successfully, False otherwise
         """
         if self.log_file.exists():
             try:
                 with open(self.log_file, 'r') as f:
-                    self.operations = json.load(f)
+                    legacy = f.read(1) == '['
+                    f.seek(0)
+                    if legacy:
+                        operations = json.load(f)
+                    else:
+                        operations = [_load_line(line) for line in f if line.strip()]
+                self.operations = operations
+                self._saved_count = len(operations)
                 return True
             except Exception:
                 return False
         return False
 
-    def undo_all(self):
+    def _is_legacy_log(self):
+        """
+        Check whether the log file uses the older single JSON array format.
+
+        Returns:
+            bool: True if the file starts with a JSON array
+        """
+        with open(self.log_file, 'rb') as f:
+            return f.read(1) == b'['
+
+    def _read_lines_reversed(self, block_size=UNDO_READ_BLOCK_SIZE):
+        """
+        Read the log file's lines from last to first.
+
+        The file is read backwards one block at a time, so memory use is
+        bounded by the block size rather than the size of the log.
+
+        Args:
+            block_size: Number of bytes to read per step
+
+        Yields:
+            bytes: Each non-empty line, newest first
+        """
+        with open(self.log_file, 'rb') as f:
+            position = f.seek(0, os.SEEK_END)
+            remainder = b''
+            while position > 0:
+                read_size = min(block_size, position)
+                position -= read_size
+                f.seek(position)
+                lines = (f.read(read_size) + remainder).split(b'\n')
+                remainder = lines.pop(0)
+                for line in reversed(lines):
+                    if line.strip():
+                        yield line
+            if remainder.strip():
+                yield remainder
+
+    def _count_lines(self, block_size=UNDO_READ_BLOCK_SIZE):
+        """
+        Count the records in the log file without parsing them.
+
+        Args:
+            block_size: Number of bytes to read per step
+
+        Returns:
+            int: Number of lines in the file
+        """
+        with open(self.log_file, 'rb') as f:
+            return sum(block.count(b'\n') for block in iter(lambda: f.read(block_size), b''))
+
+    def _iter_undo_waves(self, batch_size=UNDO_BATCH_SIZE):
+        """
+        Group logged moves, newest first, into waves that can run concurrently.
+
+        A move that touches a path used by an earlier move in the current
+        wave (say a file that was organized twice) starts a new wave, so
+        dependent moves are still undone strictly in reverse order.
+
+        Args:
+            batch_size: Most moves placed in a single wave
+
+        Yields:
+            list: (source, destination) Path pairs, with the exception in
+                place of any log entry that could not be read
+        """
+        wave = []
+        touched = set()
+        for line in self._read_lines_reversed():
+            try:
+                op = _load_line(line)
+                move = Path(op['source']), Path(op['destination'])
+            except Exception as e:
+                wave.append(e)
+                continue
+
+            if len(wave) >= batch_size or not touched.isdisjoint(move):
+                yield wave
+                wave = []
+                touched = set()
+            wave.append(move)
+            touched.update(move)
+
+        if wave:
+            yield wave
+
+    def undo_all(self, confirm=None):
         """
         Undo all logged operations.
 
+        Operations are streamed from the end of the log, so even very
+        large sessions are undone without loading the whole log.
+        Independent moves are renamed back concurrently; results are
+        still reported in reverse log order.
+
+        Args:
+            confirm: Callable taking no arguments that returns True to go
+                ahead with the undo; defaults to asking on stdin
+
         Returns:
             tuple: (undone_count, error_count)
         """
-        if not self.load() or not self.operations:
+        last_operation = None
+        if self.log_file.exists():
+            try:
+                # Rewrite logs from earlier versions as JSON Lines so they can be streamed
+                if self._is_legacy_log() and self.load():
+                    self._saved_count = None
+                    self.save()
+                last_line = next(self._read_lines_reversed(), None)
+                if last_line is not None:
+                    last_operation = _load_line(last_line)
+            except Exception:
+                last_operation = None
+
+        if last_operation is None:
             print("\n❌ No operations to undo")
             return 0, 0
 
-        print(f"\n🔄 Found {len(self.operations)} operations in last session")
-        print(f"Last operation: {self.operations[-1]['timestamp']}")
+        print(f"\n🔄 Found {self._count_lines()} operations in last session")
+        print(f"Last operation: {last_operation['timestamp']}")
 
-        if input("\nUndo all operations from last session? (y/n): ").lower() != 'y':
+        if confirm is None:
+            confirm = _confirm_undo
+        if not confirm():
             return 0, 0
 
         from .formatter import print_separator
@@ -77,21 +328,22 @@ class UndoManager:
         undone = 0
         errors = 0
 
-        for op in reversed(self.operations):
-            try:
-                source = Path(op['source'])
-                dest = Path(op['destination'])
-
-                if dest.exists():
-                    dest.rename(source)
-                    print(f"✓ Restored: {dest.name} → {source.parent}/")
-                    undone += 1
-                else:
-                    print(f"⚠ File not found: {dest.name}")
-                    errors += 1
-            except Exception as e:
-                print(f"✗ Error undoing {dest.name}: {e}")
-                errors += 1
+        with ThreadPoolExecutor(max_workers=UNDO_WORKERS) as executor:
+            for wave in self._iter_undo_waves():
+                # Waves with a single move are not worth a round trip to the pool
+                results = executor.map(_restore, wave) if len(wave) > 1 else map(_restore, wave)
+                for move, outcome in results:
+                    if outcome == 'restored':
+                        source, dest = move
+                        print(f"✓ Restored: {dest.name} → {source.parent}/")
+                        undone += 1
+                    elif outcome == 'missing':
+                        print(f"⚠ File not found: {move[1].name}")
+                        errors += 1
+                    else:
+                        name = move[1].name if isinstance(move, tuple) else 'unreadable log entry'
+                        print(f"✗ Error undoing {name}: {outcome}")
+                        errors += 1
 
         print_separator()
         print(f"\n✓ Undone: {undone} operations")
@@ -104,4 +356,5 @@ class UndoManager:
     def clear(self):
         """Clear operations and save empty log."""
         self.operations = []
+        self._saved_count = None
         self.save()
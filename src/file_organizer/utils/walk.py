@@ -0,0 +1,115 @@
+"""Directory traversal utilities."""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
+from ..config.settings import SCAN_WORKERS
+
+
+def file_extension(name):
+    """
+    Get the extension of a file name.
+
+    Returns exactly what os.path.splitext(name)[1] would, including an
+    empty extension for dotfiles like '.bashrc', but works on the bare
+    names scandir reports without splitext's separator handling.
+
+    Args:
+        name: File name without any directory part
+
+    Returns:
+        str: Extension including the leading dot, or '' if there is none
+    """
+    index = name.rfind('.')
+    # A dot is only an extension separator if a non-dot character precedes it
+    if index <= 0 or (name[0] == '.' and not name[:index].strip('.')):
+        return ''
+    return name[index:]
+
+
+def iter_files(directory, include_symlinks=True):
+    """
+    Recursively yield the files under a directory.
+
+    Uses os.scandir so file type and stat information come from the
+    directory listing rather than an extra syscall per entry; only
+    symbolic links need a stat to see what they point to. Links to
+    directories are not descended into, and unreadable directories are
+    skipped.
+
+    Args:
+        directory: Directory to walk
+        include_symlinks: If False, leave out symbolic links to files
+
+    Yields:
+        os.DirEntry: Entry for each file
+    """
+    pending = [os.fspath(directory)]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file(follow_symlinks=include_symlinks):
+                        yield entry
+        except OSError:
+            continue
+
+
+def _scan_directory(path, include_symlinks=True):
+    """
+    List one directory, splitting files from subdirectories.
+
+    Args:
+        path: Directory to list
+        include_symlinks: If False, leave out symbolic links to files
+
+    Returns:
+        tuple: (list of os.DirEntry for files, list of subdirectory paths);
+            both empty if the directory cannot be read
+    """
+    files = []
+    subdirectories = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+                elif entry.is_file(follow_symlinks=include_symlinks):
+                    files.append(entry)
+    except OSError:
+        pass
+    return files, subdirectories
+
+
+def iter_files_parallel(directory, workers=SCAN_WORKERS, include_symlinks=True):
+    """
+    Recursively yield the files under a directory, listing directories
+    concurrently.
+
+    Each directory is listed on a thread pool and its subdirectories are
+    queued as soon as it is read, so listings overlap across the tree.
+    Yields the same entries as iter_files, in no particular order.
+
+    Args:
+        directory: Directory to walk
+        workers: Number of listing threads; 1 or less walks serially
+        include_symlinks: If False, leave out symbolic links to files
+
+    Yields:
+        os.DirEntry: Entry for each file
+    """
+    if workers <= 1:
+        yield from iter_files(directory, include_symlinks=include_symlinks)
+        return
+
+    scan = partial(_scan_directory, include_symlinks=include_symlinks)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {executor.submit(scan, os.fspath(directory))}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirectories = future.result()
+                pending.update(executor.submit(scan, path) for path in subdirectories)
+                yield from files
@@ -7,6 +7,24 @@ from datetime import datetime, timedelta
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_undo_log(tmp_path, monkeypatch):
+    """Point the default undo log at a per-test file so tests never share it."""
+    monkeypatch.setattr(
+        'src.file_organizer.utils.undo_manager.UNDO_LOG_FILE',
+        tmp_path / 'undo.json'
+    )
+
+
+@pytest.fixture(autouse=True)
+def isolated_hash_cache(tmp_path, monkeypatch):
+    """Keep the duplicate finder's hash cache out of the real home directory."""
+    monkeypatch.setattr(
+        'src.file_organizer.utils.hash_cache.HASH_CACHE_FILE',
+        tmp_path / 'hashes.sqlite3'
+    )
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for testing."""
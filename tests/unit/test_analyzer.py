@@ -220,6 +220,67 @@ class TestDirectoryAnalyzer:
         # Should show human-readable sizes
         assert 'B' in captured.out or 'KB' in captured.out or 'MB' in captured.out
 
+    def test_analyze_categorizes_each_extension_once(self, temp_dir, capsys):
+        """Test that the category function is called once per extension."""
+        for i in range(5):
+            (temp_dir / f'doc{i}.txt').write_text('text')
+            (temp_dir / f'img{i}.jpg').write_text('image')
+
+        calls = []
+
+        def get_category(ext):
+            calls.append(ext)
+            return 'Documents' if ext == '.txt' else 'Images'
+
+        analyzer = DirectoryAnalyzer(get_category)
+        analyzer.analyze(temp_dir)
+
+        captured = capsys.readouterr()
+        assert 'Total Files: 10' in captured.out
+        assert sorted(calls) == ['.jpg', '.txt']
+
+    def test_analyze_merges_subtrees(self, temp_dir, capsys):
+        """Test that stats from separately walked subdirectories are merged."""
+        for i in range(4):
+            sub = temp_dir / f'sub{i}' / 'deeper'
+            sub.mkdir(parents=True)
+            (sub / f'doc{i}.txt').write_bytes(b'X' * 1024)
+            (sub.parent / f'img{i}.jpg').write_bytes(b'X' * 1024)
+        (temp_dir / 'root.txt').write_bytes(b'X' * 1024)
+
+        calls = []
+
+        def get_category(ext):
+            calls.append(ext)
+            return 'Documents' if ext == '.txt' else 'Images'
+
+        analyzer = DirectoryAnalyzer(get_category)
+        analyzer.analyze(temp_dir)
+
+        captured = capsys.readouterr()
+        assert 'Total Files: 9' in captured.out
+        assert 'Total Size: 9.00 KB' in captured.out
+        assert sorted(calls) == ['.jpg', '.txt']
+        assert 'Documents            5' in captured.out
+        assert 'Images               4' in captured.out
+
+    def test_analyze_counts_symlinked_files(self, temp_dir, capsys):
+        """Test that links to files are counted, at their target's size."""
+        sub = temp_dir / 'sub'
+        sub.mkdir()
+        (temp_dir / 'test.txt').write_bytes(b'X' * 100)
+        try:
+            (temp_dir / 'top_link.txt').symlink_to(temp_dir / 'test.txt')
+            (sub / 'nested_link.txt').symlink_to(temp_dir / 'test.txt')
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+
+        DirectoryAnalyzer(lambda ext: 'Documents').analyze(temp_dir)
+
+        captured = capsys.readouterr()
+        assert 'Total Files: 3' in captured.out
+        assert 'Total Size: 300.00 B' in captured.out
+
 
 class TestCleanEmptyFolders:
     """Test suite for clean_empty_folders function."""
@@ -410,3 +471,41 @@ class TestCleanEmptyFolders:
         assert not sub1.exists()
         assert sub2.exists()
         assert not sub3.exists()
+
+    def test_clean_dry_run_reports_nested_chain(self, temp_dir):
+        """Test that dry run counts parents that would become empty."""
+        nested = temp_dir / 'a' / 'b' / 'c'
+        nested.mkdir(parents=True)
+
+        result = clean_empty_folders(temp_dir, dry_run=True)
+
+        assert result == 3
+        assert nested.exists()
+
+    def test_clean_keeps_parent_of_non_empty_sibling(self, temp_dir):
+        """Test that a parent with one empty and one non-empty child is kept."""
+        parent = temp_dir / 'parent'
+        (parent / 'empty').mkdir(parents=True)
+        (parent / 'full').mkdir()
+        (parent / 'full' / 'file.txt').write_text('content')
+
+        result = clean_empty_folders(temp_dir)
+
+        assert result == 1
+        assert not (parent / 'empty').exists()
+        assert (parent / 'full' / 'file.txt').exists()
+
+    def test_clean_without_fwalk(self, temp_dir):
+        """Test that folders are removed by path where os.fwalk is unavailable."""
+        from unittest.mock import patch
+
+        (temp_dir / 'parent' / 'child').mkdir(parents=True)
+        (temp_dir / 'kept').mkdir()
+        (temp_dir / 'kept' / 'file.txt').write_text('content')
+
+        with patch('src.file_organizer.core.analyzer._FD_RMDIR', False):
+            result = clean_empty_folders(temp_dir)
+
+        assert result == 2
+        assert not (temp_dir / 'parent').exists()
+        assert (temp_dir / 'kept' / 'file.txt').exists()
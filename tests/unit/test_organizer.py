@@ -38,6 +38,32 @@ class TestGetCategory:
         organizer = FileOrganizer()
         assert organizer.get_category('.xyz') == 'Other'
 
+    def test_get_category_reuses_strategy(self, mocker):
+        """Test that lookups share one strategy instead of building one per call."""
+        import src.file_organizer.core.organizer as organizer_module
+
+        build = mocker.spy(organizer_module, 'OrganizeByType')
+        organizer = FileOrganizer()
+        for _ in range(3):
+            organizer.get_category('.jpg')
+
+        assert build.call_count == 1
+
+
+    def test_get_category_sees_in_place_rule_changes(self):
+        """Test that editing custom_rules directly is picked up."""
+        organizer = FileOrganizer()
+        assert organizer.get_category('.jpg') == 'Images'
+
+        organizer.custom_rules['MyImages'] = ['.jpg']
+        assert organizer.get_category('.jpg') == 'MyImages'
+
+        organizer.custom_rules['MyImages'].append('.png')
+        assert organizer.get_category('.png') == 'MyImages'
+
+        organizer.custom_rules.clear()
+        assert organizer.get_category('.jpg') == 'Images'
+
 
 class TestCustomRules:
     """Test custom categorization rules."""
@@ -78,6 +104,17 @@ class TestCustomRules:
         assert result is True
         assert 'MyCategory' not in organizer.custom_rules
 
+    def test_rule_changes_apply_after_lookups(self):
+        """Test that adding and removing rules updates later lookups."""
+        organizer = FileOrganizer()
+        assert organizer.get_category('.jpg') == 'Images'
+
+        organizer.add_custom_rule('MyImages', ['.jpg'])
+        assert organizer.get_category('.jpg') == 'MyImages'
+
+        organizer.remove_custom_rule('MyImages')
+        assert organizer.get_category('.jpg') == 'Images'
+
     def test_remove_nonexistent_rule(self):
         """Test removing a rule that doesn't exist."""
         organizer = FileOrganizer()
@@ -0,0 +1,402 @@
+"""Tests for the base organization strategy."""
+import os
+import pytest
+from pathlib import Path
+from src.file_organizer.strategies.base import OrganizationStrategy
+
+
+class DummyStrategy(OrganizationStrategy):
+    """Minimal concrete strategy for exercising base class behaviour."""
+
+    def organize(self, directory, dry_run=False):
+        return self.files_processed
+
+
+class TestMoveFile:
+    """Test suite for OrganizationStrategy.move_file."""
+
+    def test_move_to_new_folder(self, temp_dir):
+        """Test moving a file into a folder that doesn't exist yet."""
+        source = temp_dir / 'file.txt'
+        source.write_text('content')
+
+        strategy = DummyStrategy()
+        result = strategy.move_file(source, temp_dir / 'target' / 'file.txt')
+
+        assert result == temp_dir / 'target' / 'file.txt'
+        assert result.read_text() == 'content'
+        assert not source.exists()
+        assert strategy.files_processed == 1
+
+    def test_rename_on_existing_file(self, temp_dir):
+        """Test that a clash with an existing file gets a numeric suffix."""
+        target = temp_dir / 'target'
+        target.mkdir()
+        (target / 'file.txt').write_text('existing')
+
+        source = temp_dir / 'file.txt'
+        source.write_text('new')
+
+        result = DummyStrategy().move_file(source, target / 'file.txt')
+
+        assert result == target / 'file_1.txt'
+        assert (target / 'file.txt').read_text() == 'existing'
+        assert result.read_text() == 'new'
+
+    def test_repeated_clashes_get_increasing_suffixes(self, temp_dir):
+        """Test that many files with the same name all get unique names."""
+        target = temp_dir / 'target'
+        strategy = DummyStrategy()
+
+        results = []
+        for i in range(5):
+            source_dir = temp_dir / f'src{i}'
+            source_dir.mkdir()
+            source = source_dir / 'same.txt'
+            source.write_text(str(i))
+            results.append(strategy.move_file(source, target / 'same.txt'))
+
+        assert [r.name for r in results] == [
+            'same.txt', 'same_1.txt', 'same_2.txt', 'same_3.txt', 'same_4.txt'
+        ]
+        assert [r.read_text() for r in results] == ['0', '1', '2', '3', '4']
+
+    def test_suffix_skips_names_already_taken(self, temp_dir):
+        """Test that generated names avoid pre-existing suffixed files."""
+        target = temp_dir / 'target'
+        target.mkdir()
+        (target / 'file.txt').write_text('a')
+        (target / 'file_1.txt').write_text('b')
+
+        source = temp_dir / 'file.txt'
+        source.write_text('c')
+
+        result = DummyStrategy().move_file(source, target / 'file.txt')
+
+        assert result == target / 'file_2.txt'
+
+    def test_file_created_after_listing_is_not_overwritten(self, temp_dir):
+        """Test that a file the folder listing missed still gets a suffix."""
+        target = temp_dir / 'target'
+        strategy = DummyStrategy()
+
+        first = temp_dir / 'x.txt'
+        first.write_text('x')
+        strategy.move_file(first, target / 'x.txt')
+
+        (target / 'y.txt').write_text('existing')
+        source = temp_dir / 'y.txt'
+        source.write_text('new')
+        result = strategy.move_file(source, target / 'y.txt')
+
+        assert result == target / 'y_1.txt'
+        assert (target / 'y.txt').read_text() == 'existing'
+        assert result.read_text() == 'new'
+
+    def test_case_insensitive_names_clash(self, temp_dir):
+        """Test that names differing only in case clash where case is ignored."""
+        from unittest.mock import patch
+
+        target = temp_dir / 'target'
+        target.mkdir()
+        (target / 'Report.pdf').write_text('existing')
+        source = temp_dir / 'report.pdf'
+        source.write_text('new')
+
+        with patch('src.file_organizer.strategies.base._CASE_INSENSITIVE', True):
+            result = DummyStrategy().move_file(source, target / 'report.pdf')
+
+        assert result == target / 'report_1.pdf'
+        assert (target / 'Report.pdf').read_text() == 'existing'
+
+    def test_reset_forgets_folder_contents(self, temp_dir):
+        """Test that reset re-reads folders changed outside the strategy."""
+        target = temp_dir / 'target'
+        strategy = DummyStrategy()
+
+        first = temp_dir / 'file.txt'
+        first.write_text('first')
+        moved = strategy.move_file(first, target / 'file.txt')
+        moved.unlink()
+
+        strategy.reset()
+        second = temp_dir / 'file.txt'
+        second.write_text('second')
+        result = strategy.move_file(second, target / 'file.txt')
+
+        assert result == target / 'file.txt'
+        assert strategy.files_processed == 1
+
+    def test_target_folder_created_once(self, temp_dir, mocker):
+        """Test that moves into the same folder create it only once."""
+        import os
+
+        makedirs = mocker.spy(os, 'makedirs')
+        strategy = DummyStrategy()
+        for i in range(3):
+            source = temp_dir / f'file{i}.txt'
+            source.write_text('content')
+            strategy.move_file(source, temp_dir / 'target' / source.name)
+
+        assert makedirs.call_count == 1
+        assert len(list((temp_dir / 'target').iterdir())) == 3
+
+    def test_dry_run_does_not_move(self, temp_dir):
+        """Test that dry run leaves the file in place."""
+        source = temp_dir / 'file.txt'
+        source.write_text('content')
+
+        strategy = DummyStrategy()
+        result = strategy.move_file(source, temp_dir / 'target' / 'file.txt', dry_run=True)
+
+        assert result == temp_dir / 'target' / 'file.txt'
+        assert source.exists()
+        assert not (temp_dir / 'target').exists()
+        assert strategy.files_processed == 1
+
+    def test_cross_device_move_falls_back_to_shutil(self, temp_dir):
+        """Test that a cross-filesystem rename falls back to shutil.move."""
+        import errno
+        from unittest.mock import patch
+
+        source = temp_dir / 'file.txt'
+        source.write_text('content')
+        destination = temp_dir / 'target' / 'file.txt'
+
+        cross_device = OSError(errno.EXDEV, 'Invalid cross-device link')
+        with patch('src.file_organizer.strategies.base.os.link', side_effect=cross_device), \
+                patch('src.file_organizer.strategies.base.os.replace', side_effect=cross_device), \
+                patch('shutil.move') as mock_move:
+            DummyStrategy().move_file(source, destination)
+
+        mock_move.assert_called_once_with(str(source), str(destination))
+
+    def test_other_rename_errors_propagate(self, temp_dir):
+        """Test that rename errors other than EXDEV are not swallowed."""
+        import errno
+        from unittest.mock import patch
+
+        source = temp_dir / 'file.txt'
+        source.write_text('content')
+
+        denied = OSError(errno.EACCES, 'Permission denied')
+        with patch('src.file_organizer.strategies.base.os.link', side_effect=denied), \
+                patch('src.file_organizer.strategies.base.os.replace', side_effect=denied):
+            with pytest.raises(OSError):
+                DummyStrategy().move_file(source, temp_dir / 'target' / 'file.txt')
+
+        assert source.exists()
+
+    def test_falls_back_to_rename_without_hard_links(self, temp_dir):
+        """Test that a filesystem refusing hard links still gets the file moved."""
+        import errno
+        from unittest.mock import patch
+
+        source = temp_dir / 'file.txt'
+        source.write_text('content')
+        destination = temp_dir / 'target' / 'file.txt'
+
+        with patch('src.file_organizer.strategies.base.os.link',
+                   side_effect=OSError(errno.EPERM, 'Operation not permitted')):
+            DummyStrategy().move_file(source, destination)
+
+        assert destination.read_text() == 'content'
+        assert not source.exists()
+
+    def test_symlink_moved_as_link(self, temp_dir):
+        """Test that moving a symbolic link keeps it a link to the same file."""
+        (temp_dir / 'real.txt').write_text('content')
+        link = temp_dir / 'link.txt'
+        try:
+            link.symlink_to(temp_dir / 'real.txt')
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+
+        result = DummyStrategy().move_file(link, temp_dir / 'target' / 'link.txt')
+
+        assert result.is_symlink()
+        assert result.read_text() == 'content'
+        assert (temp_dir / 'real.txt').exists()
+
+
+class TestQueuedMoves:
+    """Test suite for queued moves and flush_moves."""
+
+    def test_moves_happen_on_flush(self, temp_dir):
+        """Test that queued files stay put until the queue is flushed."""
+        source = temp_dir / 'file.txt'
+        source.write_text('content')
+        destination = temp_dir / 'target' / 'file.txt'
+
+        strategy = DummyStrategy()
+        strategy._queue_move(str(source), str(destination))
+
+        assert source.exists()
+        assert strategy.files_processed == 0
+
+        strategy.flush_moves()
+
+        assert destination.read_text() == 'content'
+        assert strategy.files_processed == 1
+
+    def test_large_batch_moved_and_logged_in_order(self, temp_dir):
+        """Test that a batch large enough for the thread pool is fully moved."""
+        from src.file_organizer.utils.undo_manager import UndoManager
+
+        undo_manager = UndoManager(temp_dir / 'undo.jsonl')
+        strategy = DummyStrategy(undo_manager)
+        sources = []
+        for i in range(20):
+            source = temp_dir / f'file{i}.txt'
+            source.write_text(str(i))
+            sources.append(source)
+            strategy._queue_move(str(source), str(temp_dir / 'target' / source.name))
+
+        strategy.flush_moves()
+
+        assert strategy.files_processed == 20
+        assert not any(source.exists() for source in sources)
+        assert [op['source'] for op in undo_manager.operations] == [str(s) for s in sources]
+
+    def test_queue_flushes_when_batch_is_full(self, temp_dir):
+        """Test that reaching the batch size carries out the queued moves."""
+        from unittest.mock import patch
+
+        strategy = DummyStrategy()
+        with patch('src.file_organizer.strategies.base.MOVE_BATCH_SIZE', 2):
+            for i in range(3):
+                source = temp_dir / f'file{i}.txt'
+                source.write_text('content')
+                strategy._queue_move(str(source), str(temp_dir / 'target' / source.name))
+
+        assert strategy.files_processed == 2
+        assert (temp_dir / 'file2.txt').exists()
+
+    def test_failed_move_raised_after_batch(self, temp_dir):
+        """Test that other moves complete and are logged when one fails."""
+        from src.file_organizer.utils.undo_manager import UndoManager
+
+        undo_manager = UndoManager(temp_dir / 'undo.jsonl')
+        strategy = DummyStrategy(undo_manager)
+        (temp_dir / 'a.txt').write_text('a')
+        (temp_dir / 'c.txt').write_text('c')
+        for name in ('a.txt', 'missing.txt', 'c.txt'):
+            strategy._queue_move(str(temp_dir / name), str(temp_dir / 'target' / name))
+
+        with pytest.raises(FileNotFoundError):
+            strategy.flush_moves()
+
+        assert strategy.files_processed == 2
+        assert len(undo_manager.operations) == 2
+        assert (temp_dir / 'target' / 'c.txt').exists()
+
+    def test_flush_saves_undo_log(self, temp_dir):
+        """Test that each flushed batch is written to the undo log."""
+        from src.file_organizer.utils.undo_manager import UndoManager
+
+        log_file = temp_dir / 'undo.jsonl'
+        strategy = DummyStrategy(UndoManager(log_file))
+        (temp_dir / 'a.txt').write_text('a')
+        strategy._queue_move(str(temp_dir / 'a.txt'), str(temp_dir / 'target' / 'a.txt'))
+        strategy.flush_moves()
+
+        assert len(log_file.read_text().splitlines()) == 1
+
+    def test_queued_move_does_not_overwrite_new_file(self, temp_dir):
+        """Test that a file created after its name was claimed is kept."""
+        source = temp_dir / 'file.txt'
+        source.write_text('new')
+        target = temp_dir / 'target'
+
+        strategy = DummyStrategy()
+        strategy._queue_move(str(source), str(target / 'file.txt'))
+        (target / 'file.txt').write_text('existing')
+        strategy.flush_moves()
+
+        assert (target / 'file.txt').read_text() == 'existing'
+        assert (target / 'file_1.txt').read_text() == 'new'
+        assert strategy.files_processed == 1
+
+
+class TestScanFiles:
+    """Test suite for OrganizationStrategy.scan_files."""
+
+    def test_lists_top_level_files_only(self, temp_dir):
+        """Test that folders and their contents are not listed."""
+        (temp_dir / 'a.txt').write_text('a')
+        (temp_dir / 'sub').mkdir()
+        (temp_dir / 'sub' / 'b.txt').write_text('b')
+
+        names = [entry.name for entry in DummyStrategy().scan_files(temp_dir)]
+
+        assert names == ['a.txt']
+
+    def test_symlinked_files_listed(self, temp_dir):
+        """Test that links to files are organized like the files themselves."""
+        (temp_dir / 'a.txt').write_text('a')
+        (temp_dir / 'sub').mkdir()
+        try:
+            (temp_dir / 'link.txt').symlink_to(temp_dir / 'a.txt')
+            (temp_dir / 'link_dir').symlink_to(temp_dir / 'sub', target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+
+        names = sorted(entry.name for entry in DummyStrategy().scan_files(temp_dir))
+
+        assert names == ['a.txt', 'link.txt']
+
+    @pytest.mark.skipif(os.name == 'nt', reason="listing order is kept on Windows")
+    def test_files_listed_in_inode_order(self, temp_dir):
+        """Test that files come back sorted by inode number."""
+        for i in range(10):
+            (temp_dir / f'file{i}.txt').write_text(str(i))
+
+        entries = DummyStrategy().scan_files(temp_dir)
+        inodes = [entry.inode() for entry in entries]
+
+        assert inodes == sorted(inodes)
+
+    def test_skips_undo_log(self, temp_dir):
+        """Test that the undo log is never offered for organizing."""
+        from src.file_organizer.utils.undo_manager import UndoManager
+
+        log_file = temp_dir / 'undo.jsonl'
+        log_file.write_text('')
+        (temp_dir / 'a.txt').write_text('a')
+
+        strategy = DummyStrategy(UndoManager(log_file))
+        names = [entry.name for entry in strategy.scan_files(temp_dir)]
+
+        assert names == ['a.txt']
+
+    def test_keeps_file_named_like_log_elsewhere(self, temp_dir):
+        """Test that only the log itself is skipped, not files sharing its name."""
+        from src.file_organizer.utils.undo_manager import UndoManager
+
+        (temp_dir / 'logs').mkdir()
+        (temp_dir / 'work').mkdir()
+        (temp_dir / 'work' / 'undo.jsonl').write_text('')
+
+        strategy = DummyStrategy(UndoManager(temp_dir / 'logs' / 'undo.jsonl'))
+        names = [entry.name for entry in strategy.scan_files(temp_dir / 'work')]
+
+        assert names == ['undo.jsonl']
+
+    def test_skips_undo_log_behind_symlink(self, temp_dir):
+        """Test that a log reached through a link is skipped under either name."""
+        from src.file_organizer.utils.undo_manager import UndoManager
+
+        (temp_dir / 'work').mkdir()
+        (temp_dir / 'logs').mkdir()
+        log_file = temp_dir / 'work' / 'undo.jsonl'
+        log_file.write_text('')
+        try:
+            (temp_dir / 'logs' / 'current.jsonl').symlink_to(log_file)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+        (temp_dir / 'work' / 'a.txt').write_text('a')
+
+        strategy = DummyStrategy(UndoManager(temp_dir / 'logs' / 'current.jsonl'))
+
+        assert [e.name for e in strategy.scan_files(temp_dir / 'work')] == ['a.txt']
+        assert strategy.scan_files(temp_dir / 'logs') == []
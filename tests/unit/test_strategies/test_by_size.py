@@ -1,10 +1,42 @@
 """Tests for organize by size strategy."""
+import os
 import pytest
 from pathlib import Path
 from src.file_organizer.strategies.by_size import OrganizeBySize
 from src.file_organizer.utils.undo_manager import UndoManager
 
 
+def make_sized_file(path, size):
+    """Create a sparse file of the given size; only its size is ever read."""
+    with open(path, 'wb') as f:
+        os.ftruncate(f.fileno(), size)
+
+
+class TestGetCategory:
+    """Test suite for size category lookup."""
+
+    def test_each_category(self):
+        """Test a representative size from each category."""
+        mb = 1024 * 1024
+        assert OrganizeBySize.get_category(0) == 'Tiny (under 1MB)'
+        assert OrganizeBySize.get_category(5 * mb) == 'Small (1-10MB)'
+        assert OrganizeBySize.get_category(50 * mb) == 'Medium (10-100MB)'
+        assert OrganizeBySize.get_category(500 * mb) == 'Large (100MB-1GB)'
+        assert OrganizeBySize.get_category(5 * 1024 * mb) == 'Huge (over 1GB)'
+
+    def test_boundaries_belong_to_upper_category(self):
+        """Test that a size equal to a bound falls in the higher category."""
+        mb = 1024 * 1024
+        assert OrganizeBySize.get_category(mb - 1) == 'Tiny (under 1MB)'
+        assert OrganizeBySize.get_category(mb) == 'Small (1-10MB)'
+        assert OrganizeBySize.get_category(10 * mb) == 'Medium (10-100MB)'
+        assert OrganizeBySize.get_category(1024 * mb) == 'Huge (over 1GB)'
+
+    def test_size_below_all_categories(self):
+        """Test that a size no category covers has no category."""
+        assert OrganizeBySize.get_category(-1) is None
+
+
 class TestOrganizeBySize:
     """Test suite for organize by size strategy."""
 
@@ -28,7 +60,7 @@ class TestOrganizeBySize:
     def test_organize_small_files(self, temp_dir):
         """Test organizing files 1-10MB."""
         file = temp_dir / 'small.dat'
-        file.write_bytes(b'X' * (2 * 1024 * 1024))  # 2MB
+        make_sized_file(file, 2 * 1024 * 1024)  # 2MB
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -39,7 +71,7 @@ class TestOrganizeBySize:
     def test_organize_medium_files(self, temp_dir):
         """Test organizing files 10-100MB."""
         file = temp_dir / 'medium.dat'
-        file.write_bytes(b'X' * (15 * 1024 * 1024))  # 15MB
+        make_sized_file(file, 15 * 1024 * 1024)  # 15MB
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -50,7 +82,7 @@ class TestOrganizeBySize:
     def test_organize_large_files(self, temp_dir):
         """Test organizing files 100MB-1GB."""
         file = temp_dir / 'large.dat'
-        file.write_bytes(b'X' * (150 * 1024 * 1024))  # 150MB
+        make_sized_file(file, 150 * 1024 * 1024)  # 150MB
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -61,8 +93,8 @@ class TestOrganizeBySize:
     def test_organize_huge_files(self, temp_dir):
         """Test organizing files > 1GB."""
         file = temp_dir / 'huge.dat'
-        # Create a file that simulates being huge (actual size for testing)
-        file.write_bytes(b'X' * (1024 * 1024 * 1024 + 1))  # Just over 1GB
+        # Sparse, so no gigabyte is actually written
+        make_sized_file(file, 1024 * 1024 * 1024 + 1)  # Just over 1GB
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -80,7 +112,7 @@ class TestOrganizeBySize:
 
         for filename, size in files_with_sizes.items():
             file = temp_dir / filename
-            file.write_bytes(b'X' * size)
+            make_sized_file(file, size)
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -94,15 +126,15 @@ class TestOrganizeBySize:
         """Test files at exact size boundaries."""
         # Exactly 1MB (should be Small, not Tiny)
         file_1mb = temp_dir / '1mb.dat'
-        file_1mb.write_bytes(b'X' * (1024 * 1024))
+        make_sized_file(file_1mb, 1024 * 1024)
 
         # Exactly 10MB (should be Medium, not Small)
         file_10mb = temp_dir / '10mb.dat'
-        file_10mb.write_bytes(b'X' * (10 * 1024 * 1024))
+        make_sized_file(file_10mb, 10 * 1024 * 1024)
 
         # Exactly 100MB (should be Large, not Medium)
         file_100mb = temp_dir / '100mb.dat'
-        file_100mb.write_bytes(b'X' * (100 * 1024 * 1024))
+        make_sized_file(file_100mb, 100 * 1024 * 1024)
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -224,7 +256,7 @@ class TestOrganizeBySize:
 
         for filename, size in files.items():
             file = temp_dir / filename
-            file.write_bytes(b'X' * size)
+            make_sized_file(file, size)
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -277,11 +309,11 @@ class TestOrganizeBySize:
         """Test files just under size boundaries."""
         # Just under 1MB
         file_under_1mb = temp_dir / 'under_1mb.dat'
-        file_under_1mb.write_bytes(b'X' * (1024 * 1024 - 1))
+        make_sized_file(file_under_1mb, 1024 * 1024 - 1)
 
         # Just under 10MB
         file_under_10mb = temp_dir / 'under_10mb.dat'
-        file_under_10mb.write_bytes(b'X' * (10 * 1024 * 1024 - 1))
+        make_sized_file(file_under_10mb, 10 * 1024 * 1024 - 1)
 
         strategy = OrganizeBySize()
         result = strategy.organize(temp_dir)
@@ -320,7 +352,7 @@ class TestOrganizeBySize:
 
         for filename, size in files_with_sizes.items():
             file = temp_dir / filename
-            file.write_bytes(b'X' * min(size, 10 * 1024 * 1024))  # Cap at 10MB for test speed
+            make_sized_file(file, size)
 
         strategy = OrganizeBySize()
         # We'll only create smaller files for actual testing
@@ -335,7 +367,7 @@ class TestOrganizeBySize:
 
         for filename, size in small_files.items():
             file = temp_dir2 / filename
-            file.write_bytes(b'X' * size)
+            make_sized_file(file, size)
 
         result = strategy.organize(temp_dir2)
 
@@ -100,6 +100,58 @@ class TestGetCategory:
         assert strategy.get_category('.jpg') == 'MyImages'
         assert strategy.get_category('.png') == 'MyImages'
 
+    def test_first_custom_rule_wins(self):
+        """Test that the first custom rule listing an extension wins."""
+        custom_rules = {
+            'First': ['.shared'],
+            'Second': ['.shared', '.other'],
+        }
+        strategy = OrganizeByType(custom_rules=custom_rules)
+        assert strategy.get_category('.shared') == 'First'
+        assert strategy.get_category('.other') == 'Second'
+
+    def test_repeated_lookups_are_cached(self, mocker):
+        """Test that each distinct extension is resolved only once."""
+        strategy = OrganizeByType()
+        lookup = mocker.spy(strategy, '_lookup_category')
+
+        for _ in range(3):
+            assert strategy.get_category('.JPG') == 'Images'
+            assert strategy.get_category('.txt') == 'Documents'
+
+        assert lookup.call_count == 2
+
+    def test_assigning_custom_rules_rebuilds_lookup(self):
+        """Test that replacing the rules invalidates cached categories."""
+        strategy = OrganizeByType()
+        assert strategy.get_category('.jpg') == 'Images'
+
+        strategy.custom_rules = {'Photos': ['.jpg']}
+        assert strategy.get_category('.jpg') == 'Photos'
+
+    def test_refresh_rules_after_in_place_change(self):
+        """Test that refresh_rules picks up rules mutated in place."""
+        custom_rules = {}
+        strategy = OrganizeByType(custom_rules=custom_rules)
+        assert strategy.get_category('.custom') == 'Other'
+
+        custom_rules['Custom'] = ['.custom']
+        strategy.refresh_rules()
+        assert strategy.get_category('.custom') == 'Custom'
+
+    def test_builtin_table_shared_without_custom_rules(self):
+        """Test that strategies without custom rules don't copy the built-in table."""
+        from src.file_organizer.config.file_types import EXTENSION_TO_CATEGORY
+
+        first = OrganizeByType()
+        second = OrganizeByType()
+        custom = OrganizeByType(custom_rules={'Photos': ['.jpg']})
+
+        assert first._extension_index is EXTENSION_TO_CATEGORY
+        assert second._extension_index is EXTENSION_TO_CATEGORY
+        assert custom.get_category('.jpg') == 'Photos'
+        assert EXTENSION_TO_CATEGORY['.jpg'] == 'Images'
+
     def test_compound_extension(self):
         """Test handling of compound extensions."""
         strategy = OrganizeByType()
@@ -331,3 +383,32 @@ class TestOrganize:
         strategy.organize(temp_dir)
 
         assert strategy.files_processed == 5
+
+    def test_failed_move_not_reported_and_others_undoable(self, temp_dir, capsys):
+        """Test that only completed moves are reported and saved for undo."""
+        from unittest.mock import patch
+        from src.file_organizer.strategies import base
+
+        log_file = temp_dir / 'logs' / 'undo.jsonl'
+        log_file.parent.mkdir()
+        undo_mgr = UndoManager(log_file=log_file)
+        (temp_dir / 'good.txt').write_text('good')
+        (temp_dir / 'bad.jpg').write_text('bad')
+        real_rename = base._rename
+
+        def rename(source, destination):
+            if source.endswith('bad.jpg'):
+                raise PermissionError(source)
+            real_rename(source, destination)
+
+        with patch('src.file_organizer.strategies.base._rename', side_effect=rename):
+            with pytest.raises(PermissionError):
+                OrganizeByType(undo_manager=undo_mgr).organize(temp_dir)
+
+        output = capsys.readouterr().out
+        assert '[MOVED] good.txt' in output
+        assert 'bad.jpg' not in output
+
+        saved = UndoManager(log_file=log_file)
+        assert saved.load()
+        assert [Path(op['destination']).name for op in saved.operations] == ['good.txt']
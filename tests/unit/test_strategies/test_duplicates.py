@@ -362,3 +362,336 @@ class TestDuplicateFinder:
         # Total: 2500 bytes
         assert finder.space_saved == 2500
         assert finder.duplicates_found == 3
+
+    def test_uses_configured_hash_algorithm(self, temp_dir):
+        """Test that duplicate detection hashes with the configured algorithm."""
+        from unittest.mock import patch
+        from src.file_organizer.config.settings import DUPLICATE_HASH_ALGORITHM
+
+        content = b'same' * 2048
+        (temp_dir / 'a.txt').write_bytes(content)
+        (temp_dir / 'b.txt').write_bytes(content)
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_hash',
+                   return_value='hash') as mock_hash:
+            DuplicateFinder().find_duplicates(temp_dir)
+
+        assert mock_hash.call_count == 2
+        for call in mock_hash.call_args_list:
+            assert call.args[1] == DUPLICATE_HASH_ALGORITHM
+
+    def test_unique_sizes_are_not_hashed(self, temp_dir):
+        """Test that files with a unique size are never fully hashed."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_bytes(b'one')
+        (temp_dir / 'b.txt').write_bytes(b'three')
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_hash') as mock_hash:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert duplicates == []
+        mock_hash.assert_not_called()
+
+    def test_same_size_different_prefix_not_fully_hashed(self, temp_dir):
+        """Test that a differing prefix rules files out before a full hash."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_bytes(b'A' * 8192)
+        (temp_dir / 'b.txt').write_bytes(b'B' * 8192)
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_hash') as mock_hash:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert duplicates == []
+        mock_hash.assert_not_called()
+
+    def test_many_groups_hashed_concurrently(self, temp_dir):
+        """Test that concurrent hashing keeps every group intact."""
+        for group in range(20):
+            content = f'group {group:02d} content'.encode()
+            for copy in range(3):
+                (temp_dir / f'g{group:02d}_{copy}.txt').write_bytes(content)
+
+        finder = DuplicateFinder()
+        duplicates = finder.find_duplicates(temp_dir)
+
+        assert len(duplicates) == 20
+        for group in duplicates:
+            assert len(group) == 3
+            assert len({f.read_bytes() for f in group}) == 1
+
+    def test_small_scan_hashes_without_pool(self, temp_dir):
+        """Test that a handful of candidates is hashed without a thread pool."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_bytes(b'same')
+        (temp_dir / 'b.txt').write_bytes(b'same')
+
+        with patch('src.file_organizer.strategies.duplicates.ThreadPoolExecutor') as mock_pool:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert len(duplicates) == 1
+        mock_pool.assert_not_called()
+
+    def test_single_worker_hashes_without_pool(self, temp_dir):
+        """Test that workers=1 hashes on the calling thread."""
+        from unittest.mock import patch
+
+        for group in range(10):
+            for copy in range(2):
+                (temp_dir / f'g{group}_{copy}.txt').write_bytes(f'group {group}'.encode())
+
+        with patch('src.file_organizer.strategies.duplicates.ThreadPoolExecutor') as mock_pool:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir, workers=1)
+
+        assert len(duplicates) == 10
+        mock_pool.assert_not_called()
+
+    def test_empty_files_are_not_read(self, temp_dir):
+        """Test that empty files are grouped without hashing."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_bytes(b'')
+        (temp_dir / 'b.txt').write_bytes(b'')
+        (temp_dir / 'c.txt').write_bytes(b'')
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_head_hash') as mock_head, \
+                patch('src.file_organizer.strategies.duplicates.get_file_hash') as mock_hash:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert len(duplicates) == 1
+        assert len(duplicates[0]) == 3
+        mock_head.assert_not_called()
+        mock_hash.assert_not_called()
+
+    def test_candidates_hashed_in_inode_order(self, temp_dir):
+        """Test that candidates are read in on-disk order, not walk order."""
+        import os
+        from unittest.mock import patch
+
+        for name in ('m.txt', 'a.txt', 'z.txt', 'c.txt'):
+            (temp_dir / name).write_bytes(b'same size')
+        for sub in ('x', 'b'):
+            (temp_dir / sub).mkdir()
+            (temp_dir / sub / 'f.txt').write_bytes(b'same size')
+
+        read_order = []
+
+        def record(path, algorithm):
+            read_order.append(os.stat(path).st_ino)
+            return 'hash'
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_head_hash',
+                   side_effect=record):
+            DuplicateFinder().find_duplicates(temp_dir, workers=1)
+
+        assert len(read_order) == 6
+        assert read_order == sorted(read_order)
+
+    def test_iter_duplicates_yields_sized_groups(self, temp_dir):
+        """Test that iter_duplicates lazily yields (size, paths) groups."""
+        import types
+
+        (temp_dir / 'a.txt').write_bytes(b'12345')
+        (temp_dir / 'b.txt').write_bytes(b'12345')
+
+        groups = DuplicateFinder().iter_duplicates(temp_dir)
+
+        assert isinstance(groups, types.GeneratorType)
+        assert list(groups) == [(5, [temp_dir / 'b.txt', temp_dir / 'a.txt'])]
+
+    def test_groups_found_across_batches(self, temp_dir):
+        """Test that splitting candidates into batches loses no groups."""
+        from unittest.mock import patch
+
+        for group in range(6):
+            content = b'x' * (group + 1)
+            for copy in range(2):
+                (temp_dir / f'g{group}_{copy}.txt').write_bytes(content)
+
+        with patch('src.file_organizer.strategies.duplicates.DUPLICATE_BATCH_FILES', 3):
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert len(duplicates) == 6
+        assert all(len(group) == 2 for group in duplicates)
+
+    def test_hash_cache_skips_unchanged_files(self, temp_dir):
+        """Test that a second scan reuses cached full hashes."""
+        from unittest.mock import patch
+        from src.file_organizer.utils.file_hash import get_file_hash
+        from src.file_organizer.utils.hash_cache import HashCache
+
+        scan_dir = temp_dir / 'scan'
+        scan_dir.mkdir()
+        content = b'cached' * 2048
+        (scan_dir / 'a.txt').write_bytes(content)
+        (scan_dir / 'b.txt').write_bytes(content)
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            first = DuplicateFinder(cache).find_duplicates(scan_dir)
+
+            with patch('src.file_organizer.strategies.duplicates.get_file_hash',
+                       side_effect=get_file_hash) as mock_hash:
+                second = DuplicateFinder(cache).find_duplicates(scan_dir)
+
+        assert len(first) == len(second) == 1
+        mock_hash.assert_not_called()
+
+    def test_hash_cache_misses_rewrite_with_restored_mtime(self, temp_dir):
+        """Test that rewriting a file and setting its mtime back is noticed."""
+        import os
+        import time
+        from src.file_organizer.utils.hash_cache import HashCache
+
+        scan_dir = temp_dir / 'scan'
+        scan_dir.mkdir()
+        content = b'cached' * 2048
+        (scan_dir / 'a.bin').write_bytes(content)
+        changed = scan_dir / 'b.bin'
+        changed.write_bytes(content)
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            assert len(DuplicateFinder(cache).find_duplicates(scan_dir)) == 1
+
+            stat = changed.stat()
+            time.sleep(0.01)  # Let the change time move on
+            changed.write_bytes(content[:-1] + b'!')
+            os.utime(changed, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+            assert DuplicateFinder(cache).find_duplicates(scan_dir) == []
+
+    def test_delete_does_not_trust_hash_cache(self, temp_dir):
+        """Test that delete mode re-reads files instead of using cached hashes."""
+        from unittest.mock import patch
+        from src.file_organizer.utils.file_hash import get_file_hash
+        from src.file_organizer.utils.hash_cache import HashCache
+
+        scan_dir = temp_dir / 'scan'
+        scan_dir.mkdir()
+        content = b'cached' * 2048
+        (scan_dir / 'a.txt').write_bytes(content)
+        (scan_dir / 'b.txt').write_bytes(content)
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            DuplicateFinder(cache).find_duplicates(scan_dir)
+
+            with patch.object(cache, 'get') as mock_get, \
+                    patch('src.file_organizer.strategies.duplicates.get_file_hash',
+                          side_effect=get_file_hash) as mock_hash:
+                duplicates = DuplicateFinder(cache).find_duplicates(scan_dir, delete=True)
+
+        assert len(duplicates) == 1
+        assert mock_hash.call_count == 2
+        mock_get.assert_not_called()
+        assert len(list(scan_dir.iterdir())) == 1
+
+    def test_symlinks_are_not_duplicates(self, temp_dir):
+        """Test that a link is never reported, so its target is never deleted."""
+        original = temp_dir / 'a.txt'
+        original.write_text('linked content')
+        try:
+            (temp_dir / 'z_link.txt').symlink_to(original)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+
+        duplicates = DuplicateFinder().find_duplicates(temp_dir, delete=True)
+
+        assert duplicates == []
+        assert original.exists()
+
+    def test_short_files_skip_full_hash(self, temp_dir):
+        """Test that files within the prefix size are only read once."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_bytes(b'short and equal')
+        (temp_dir / 'b.txt').write_bytes(b'short and equal')
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_hash') as mock_hash:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert len(duplicates) == 1
+        mock_hash.assert_not_called()
+
+    def test_report_shows_relative_paths(self, temp_dir, capsys):
+        """Test that reported paths are relative to the scanned directory."""
+        content = b'Reported duplicate content'
+        (temp_dir / 'file1.txt').write_bytes(content)
+        sub = temp_dir / 'sub'
+        sub.mkdir()
+        (sub / 'file2.txt').write_bytes(content)
+
+        DuplicateFinder().find_duplicates(temp_dir)
+
+        output = capsys.readouterr().out
+        assert f"[ORIGINAL] {Path('sub') / 'file2.txt'}" in output
+        assert "[DUPLICATE] file1.txt" in output
+        assert str(temp_dir) + '/' not in output
+
+    def test_delete_across_many_folders(self, temp_dir):
+        """Test that deletions still succeed when folder descriptors are recycled."""
+        from unittest.mock import patch
+
+        content = b'Spread out duplicate'
+        for i in range(4):
+            folder = temp_dir / f'folder{i}'
+            folder.mkdir()
+            (folder / 'copy.txt').write_bytes(content)
+
+        with patch('src.file_organizer.strategies.duplicates.DELETE_OPEN_DIRS', 1):
+            finder = DuplicateFinder()
+            finder.find_duplicates(temp_dir, delete=True)
+
+        assert finder.duplicates_found == 3
+        assert len(list(temp_dir.rglob('*.txt'))) == 1
+
+    def test_delete_without_dir_fd_support(self, temp_dir):
+        """Test that duplicates are deleted by path where dir_fd is unsupported."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_bytes(b'same')
+        (temp_dir / 'b.txt').write_bytes(b'same')
+
+        with patch('src.file_organizer.strategies.duplicates._FD_UNLINK', False):
+            finder = DuplicateFinder()
+            finder.find_duplicates(temp_dir, delete=True)
+
+        assert finder.duplicates_found == 1
+        assert (temp_dir / 'b.txt').exists()
+        assert not (temp_dir / 'a.txt').exists()
+
+    def test_hard_links_grouped_without_reading(self, temp_dir):
+        """Test that hard links to one file are duplicates without hashing."""
+        import os
+        from unittest.mock import patch
+
+        original = temp_dir / 'original.txt'
+        original.write_bytes(b'L' * 8192)
+        os.link(original, temp_dir / 'link.txt')
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_head_hash') as mock_head, \
+                patch('src.file_organizer.strategies.duplicates.get_file_hash') as mock_hash:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir)
+
+        assert duplicates == [[original, temp_dir / 'link.txt']]
+        mock_head.assert_not_called()
+        mock_hash.assert_not_called()
+
+    def test_hard_links_hashed_once(self, temp_dir):
+        """Test that a linked file and a separate copy form one group."""
+        import os
+        from unittest.mock import patch
+        from src.file_organizer.utils.file_hash import get_file_hash
+
+        content = b'L' * 8192
+        (temp_dir / 'a.txt').write_bytes(content)
+        os.link(temp_dir / 'a.txt', temp_dir / 'b.txt')
+        (temp_dir / 'c.txt').write_bytes(content)
+
+        with patch('src.file_organizer.strategies.duplicates.get_file_hash',
+                   side_effect=get_file_hash) as mock_hash:
+            duplicates = DuplicateFinder().find_duplicates(temp_dir, workers=1)
+
+        assert len(duplicates) == 1
+        assert sorted(p.name for p in duplicates[0]) == ['a.txt', 'b.txt', 'c.txt']
+        assert mock_hash.call_count == 2
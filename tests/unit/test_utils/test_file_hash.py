@@ -1,8 +1,9 @@
 """Tests for file hashing utilities."""
+import os
 import pytest
 import hashlib
 from pathlib import Path
-from src.file_organizer.utils.file_hash import get_file_hash
+from src.file_organizer.utils.file_hash import get_file_hash, get_file_hashes, get_file_head_hash
 
 
 class TestGetFileHash:
@@ -14,7 +15,7 @@ class TestGetFileHash:
         content = b'Hello, World!'
         test_file.write_bytes(content)
 
-        expected_hash = hashlib.md5(content).hexdigest()
+        expected_hash = hashlib.sha256(content).hexdigest()
         result = get_file_hash(test_file)
 
         assert result == expected_hash
@@ -24,7 +25,7 @@ class TestGetFileHash:
         test_file = temp_dir / 'empty.txt'
         test_file.write_bytes(b'')
 
-        expected_hash = hashlib.md5(b'').hexdigest()
+        expected_hash = hashlib.sha256(b'').hexdigest()
         result = get_file_hash(test_file)
 
         assert result == expected_hash
@@ -36,7 +37,7 @@ class TestGetFileHash:
         content = b'X' * (10 * 1024 * 1024)  # 10 MB
         test_file.write_bytes(content)
 
-        expected_hash = hashlib.md5(content).hexdigest()
+        expected_hash = hashlib.sha256(content).hexdigest()
         result = get_file_hash(test_file)
 
         assert result == expected_hash
@@ -47,22 +48,20 @@ class TestGetFileHash:
         content = bytes(range(256))  # All possible byte values
         test_file.write_bytes(content)
 
-        expected_hash = hashlib.md5(content).hexdigest()
+        expected_hash = hashlib.sha256(content).hexdigest()
         result = get_file_hash(test_file)
 
         assert result == expected_hash
 
-    def test_hash_with_different_algorithms(self, temp_dir):
+    @pytest.mark.parametrize('algorithm', ['md5', 'sha1', 'sha256', 'sha512', 'blake2b'])
+    def test_hash_with_different_algorithms(self, temp_dir, algorithm):
         """Test hashing with different algorithms."""
         test_file = temp_dir / 'test.txt'
         content = b'Test content for hashing'
         test_file.write_bytes(content)
 
-        algorithms = ['md5', 'sha1', 'sha256', 'sha512']
-        for algo in algorithms:
-            expected = hashlib.new(algo, content).hexdigest()
-            result = get_file_hash(test_file, algorithm=algo)
-            assert result == expected, f"Failed for algorithm: {algo}"
+        expected = hashlib.new(algorithm, content).hexdigest()
+        assert get_file_hash(test_file, algorithm=algorithm) == expected
 
     def test_same_content_same_hash(self, temp_dir):
         """Test that files with same content produce same hash."""
@@ -105,7 +104,7 @@ class TestGetFileHash:
         content = b'Unicode filename test'
         test_file.write_bytes(content)
 
-        expected_hash = hashlib.md5(content).hexdigest()
+        expected_hash = hashlib.sha256(content).hexdigest()
         result = get_file_hash(test_file)
 
         assert result == expected_hash
@@ -141,7 +140,7 @@ class TestGetFileHash:
         content = b'\x00\x01\x02\xff\xfe\xfd'  # Special bytes
         test_file.write_bytes(content)
 
-        expected_hash = hashlib.md5(content).hexdigest()
+        expected_hash = hashlib.sha256(content).hexdigest()
         result = get_file_hash(test_file)
 
         assert result == expected_hash
@@ -153,3 +152,300 @@ class TestGetFileHash:
 
         with pytest.raises(ValueError):
             get_file_hash(test_file, algorithm='invalid_algo')
+
+    def test_hash_objects_copied_from_template(self, temp_dir):
+        """Test that hashing files one after another starts from a clean state."""
+        from src.file_organizer.utils.file_hash import _hash_templates
+
+        first = temp_dir / 'first.txt'
+        second = temp_dir / 'second.txt'
+        first.write_bytes(b'first')
+        second.write_bytes(b'second')
+
+        assert get_file_hash(first, 'sha256') == hashlib.sha256(b'first').hexdigest()
+        assert get_file_hash(second, 'sha256') == hashlib.sha256(b'second').hexdigest()
+        assert _hash_templates['sha256'].hexdigest() == hashlib.sha256().hexdigest()
+
+    def test_hash_reuses_buffer_across_files(self, temp_dir):
+        """Test that a long file followed by a short one hashes correctly."""
+        long_file = temp_dir / 'long.bin'
+        short_file = temp_dir / 'short.bin'
+        long_file.write_bytes(b'L' * (3 * 1024 * 1024 + 17))
+        short_file.write_bytes(b'short')
+
+        assert get_file_hash(long_file) == hashlib.sha256(long_file.read_bytes()).hexdigest()
+        assert get_file_hash(short_file) == hashlib.sha256(b'short').hexdigest()
+
+
+    def test_hash_ignores_fadvise_failure(self, temp_dir):
+        """Test that a failing readahead hint doesn't affect the hash."""
+        import os
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'test.txt'
+        test_file.write_bytes(b'content')
+
+        with patch.object(os, 'posix_fadvise', side_effect=OSError, create=True), \
+                patch.object(os, 'POSIX_FADV_SEQUENTIAL', 2, create=True):
+            result = get_file_hash(test_file)
+
+        assert result == hashlib.sha256(b'content').hexdigest()
+
+
+    def test_hash_with_large_block_size(self, temp_dir):
+        """Test hashing when the filesystem reports a block size above the chunk size."""
+        import os
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'test.bin'
+        content = bytes(range(256)) * 20000
+        test_file.write_bytes(content)
+
+        real_fstat = os.fstat
+
+        class BigBlockStat:
+            def __init__(self, fd):
+                self._stat = real_fstat(fd)
+                self.st_blksize = 4 * 1024 * 1024
+
+            def __getattr__(self, name):
+                return getattr(self._stat, name)
+
+        with patch('src.file_organizer.utils.file_hash.os.fstat', side_effect=BigBlockStat):
+            result = get_file_hash(test_file)
+
+        assert result == hashlib.sha256(content).hexdigest()
+
+
+class TestMmapHashing:
+    """Test suite for hashing through a memory map."""
+
+    def test_mmap_matches_read_loop(self, temp_dir):
+        """Test that the mapped path produces the same digest."""
+        test_file = temp_dir / 'large.bin'
+        test_file.write_bytes(bytes(range(256)) * 20000)
+
+        assert get_file_hash(test_file, use_mmap=True) == get_file_hash(test_file)
+
+    def test_mmap_empty_file_falls_back(self, temp_dir):
+        """Test that an empty file, which cannot be mapped, is still hashed."""
+        test_file = temp_dir / 'empty.txt'
+        test_file.write_bytes(b'')
+
+        assert get_file_hash(test_file, use_mmap=True) == hashlib.sha256(b'').hexdigest()
+
+    def test_mmap_nonexistent_file(self, temp_dir):
+        """Test that a missing file still returns None."""
+        assert get_file_hash(temp_dir / 'missing.txt', use_mmap=True) is None
+
+
+class TestDirectIoHashing:
+    """Test suite for hashing large files with O_DIRECT reads."""
+
+    def test_direct_path_matches_buffered(self, temp_dir):
+        """Test that files over the threshold hash to the same digest."""
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'large.bin'
+        content = bytes(range(256)) * 20000
+        test_file.write_bytes(content)
+
+        with patch('src.file_organizer.utils.file_hash.DIRECT_IO_THRESHOLD', 1024):
+            result = get_file_hash(test_file)
+
+        assert result == hashlib.sha256(content).hexdigest()
+
+    def test_falls_back_when_direct_flag_refused(self, temp_dir):
+        """Test that a filesystem refusing O_DIRECT falls back to buffered reads."""
+        import errno
+        from unittest.mock import MagicMock, patch
+
+        test_file = temp_dir / 'large.bin'
+        content = b'X' * 10000
+        test_file.write_bytes(content)
+
+        fake_fcntl = MagicMock()
+        fake_fcntl.fcntl.side_effect = OSError(errno.EINVAL, 'Invalid argument')
+        with patch('src.file_organizer.utils.file_hash.DIRECT_IO_THRESHOLD', 1024), \
+                patch('src.file_organizer.utils.file_hash.fcntl', fake_fcntl):
+            result = get_file_hash(test_file)
+
+        assert result == hashlib.sha256(content).hexdigest()
+
+    @pytest.mark.skipif(not hasattr(os, 'O_DIRECT'), reason="O_DIRECT not available")
+    def test_direct_reads_use_the_open_file(self, temp_dir):
+        """Test that direct reads go through the descriptor already opened."""
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'large.bin'
+        content = bytes(range(256)) * 20000
+        test_file.write_bytes(content)
+
+        with patch('src.file_organizer.utils.file_hash.DIRECT_IO_THRESHOLD', 1024), \
+                patch('src.file_organizer.utils.file_hash.os.open',
+                      side_effect=AssertionError('file reopened')):
+            result = get_file_hash(test_file)
+
+        assert result == hashlib.sha256(content).hexdigest()
+
+    def test_falls_back_when_direct_read_rejected(self, temp_dir):
+        """Test that an EINVAL on the first direct read falls back cleanly."""
+        import errno
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'large.bin'
+        content = b'X' * 10000
+        test_file.write_bytes(content)
+
+        with patch('src.file_organizer.utils.file_hash.DIRECT_IO_THRESHOLD', 1024), \
+                patch('src.file_organizer.utils.file_hash.os.readv',
+                      side_effect=OSError(errno.EINVAL, 'Invalid argument')):
+            result = get_file_hash(test_file)
+
+        assert result == hashlib.sha256(content).hexdigest()
+
+    def test_small_files_skip_direct_io(self, temp_dir):
+        """Test that files under the threshold never open with O_DIRECT."""
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'small.txt'
+        test_file.write_bytes(b'content')
+
+        with patch('src.file_organizer.utils.file_hash._hash_direct') as mock_direct:
+            result = get_file_hash(test_file)
+
+        mock_direct.assert_not_called()
+        assert result == hashlib.sha256(b'content').hexdigest()
+
+
+class TestXxhashAlgorithm:
+    """Test suite for the optional xxh3_128 algorithm."""
+
+    def test_uses_xxhash_when_installed(self, temp_dir):
+        """Test that xxh3_128 hashes through the xxhash package."""
+        from unittest.mock import MagicMock, patch
+
+        test_file = temp_dir / 'test.txt'
+        test_file.write_bytes(b'content')
+
+        fake_xxhash = MagicMock()
+        fake_xxhash.xxh3_128.side_effect = hashlib.md5
+        with patch('src.file_organizer.utils.file_hash.xxhash', fake_xxhash), \
+                patch.dict('src.file_organizer.utils.file_hash._hash_templates', clear=True):
+            result = get_file_hash(test_file, 'xxh3_128')
+
+        fake_xxhash.xxh3_128.assert_called_once_with()
+        assert result == hashlib.md5(b'content').hexdigest()
+
+    def test_unavailable_without_xxhash(self, temp_dir):
+        """Test that xxh3_128 is rejected like an unknown algorithm."""
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'test.txt'
+        test_file.write_bytes(b'content')
+
+        with patch('src.file_organizer.utils.file_hash.xxhash', None), \
+                patch.dict('src.file_organizer.utils.file_hash._hash_templates', clear=True):
+            with pytest.raises(ValueError):
+                get_file_hash(test_file, 'xxh3_128')
+
+
+class TestBlake3Algorithm:
+    """Test suite for the optional blake3 algorithm."""
+
+    def test_uses_blake3_when_installed(self, temp_dir):
+        """Test that blake3 hashes through the blake3 package."""
+        from unittest.mock import MagicMock, patch
+
+        test_file = temp_dir / 'test.txt'
+        test_file.write_bytes(b'content')
+
+        fake_blake3 = MagicMock()
+        fake_blake3.blake3.side_effect = hashlib.sha256
+        with patch('src.file_organizer.utils.file_hash.blake3', fake_blake3), \
+                patch.dict('src.file_organizer.utils.file_hash._hash_templates', clear=True):
+            result = get_file_hash(test_file, 'blake3')
+
+        fake_blake3.blake3.assert_called_once_with()
+        assert result == hashlib.sha256(b'content').hexdigest()
+
+    def test_unavailable_without_blake3(self, temp_dir):
+        """Test that blake3 is rejected like an unknown algorithm."""
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'test.txt'
+        test_file.write_bytes(b'content')
+
+        with patch('src.file_organizer.utils.file_hash.blake3', None), \
+                patch.dict('src.file_organizer.utils.file_hash._hash_templates', clear=True):
+            with pytest.raises(ValueError):
+                get_file_hash(test_file, 'blake3')
+
+
+class TestGetFileHashes:
+    """Test suite for get_file_hashes function."""
+
+    def test_batch_matches_sequential(self, temp_dir):
+        """Test that batch hashing matches hashing files one at a time."""
+        paths = []
+        for i in range(50):
+            path = temp_dir / f'file{i}.txt'
+            path.write_text(f'content {i % 10}')
+            paths.append(path)
+
+        result = get_file_hashes(paths, workers=4)
+
+        assert result == [get_file_hash(path) for path in paths]
+
+    def test_single_worker(self, temp_dir):
+        """Test that workers=1 hashes on the calling thread."""
+        from unittest.mock import patch
+
+        test_file = temp_dir / 'file.txt'
+        test_file.write_bytes(b'content')
+
+        with patch('src.file_organizer.utils.file_hash.ThreadPoolExecutor') as mock_pool:
+            result = get_file_hashes([test_file, test_file], 'md5', workers=1)
+
+        mock_pool.assert_not_called()
+        assert result == [hashlib.md5(b'content').hexdigest()] * 2
+
+    def test_failed_file_is_none(self, temp_dir):
+        """Test that an unreadable file yields None in its position."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_bytes(b'content')
+
+        result = get_file_hashes([temp_dir / 'missing.txt', test_file], workers=2)
+
+        assert result == [None, hashlib.sha256(b'content').hexdigest()]
+
+    def test_invalid_algorithm(self, temp_dir):
+        """Test that an unknown algorithm raises before any file is read."""
+        with pytest.raises(ValueError):
+            get_file_hashes([temp_dir / 'file.txt'], algorithm='invalid_algo')
+
+
+class TestGetFileHeadHash:
+    """Test suite for get_file_head_hash function."""
+
+    def test_head_hash_small_file(self, temp_dir):
+        """Test that a file shorter than the prefix hashes in full."""
+        test_file = temp_dir / 'small.txt'
+        content = b'Short content'
+        test_file.write_bytes(content)
+
+        assert get_file_head_hash(test_file) == hashlib.sha256(content).hexdigest()
+
+    def test_head_hash_only_reads_prefix(self, temp_dir):
+        """Test that only the leading bytes contribute to the hash."""
+        file1 = temp_dir / 'file1.bin'
+        file2 = temp_dir / 'file2.bin'
+        file1.write_bytes(b'A' * 100 + b'tail one')
+        file2.write_bytes(b'A' * 100 + b'tail two')
+
+        assert get_file_head_hash(file1, length=100) == get_file_head_hash(file2, length=100)
+        assert get_file_hash(file1) != get_file_hash(file2)
+
+    def test_head_hash_nonexistent_file(self, temp_dir):
+        """Test head hashing a file that doesn't exist."""
+        assert get_file_head_hash(temp_dir / 'missing.txt') is None
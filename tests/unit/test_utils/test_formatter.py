@@ -2,7 +2,7 @@
 import pytest
 from io import StringIO
 import sys
-from src.file_organizer.utils.formatter import format_size, print_separator, print_header
+from src.file_organizer.utils.formatter import format_size, print_separator, print_header, OutputBuffer
 
 
 class TestFormatSize:
@@ -62,6 +62,12 @@ class TestFormatSize:
         result = format_size(huge_size)
         assert result.endswith("PB")
 
+    def test_format_unit_boundaries(self):
+        """Test values just below each unit boundary stay in the lower unit."""
+        assert format_size(1024 ** 2 - 1) == "1024.00 KB"
+        assert format_size(1024 ** 3 - 1) == "1024.00 MB"
+        assert format_size(1024 ** 6) == "1024.00 PB"
+
     def test_format_fractional_bytes(self):
         """Test formatting with fractional byte input."""
         assert format_size(1.5) == "1.50 B"
@@ -198,3 +204,46 @@ class TestPrintHeader:
         # Each header has 3 lines, plus blank lines between
         assert "  First" in captured.out
         assert "  Second" in captured.out
+
+
+class TestOutputBuffer:
+    """Test suite for OutputBuffer class."""
+
+    def test_lines_written_on_exit(self, capsys):
+        """Test that queued lines are written when the context exits."""
+        with OutputBuffer() as output:
+            output.add("first")
+            output.add("second")
+            assert capsys.readouterr().out == ""
+
+        assert capsys.readouterr().out == "first\nsecond\n"
+
+    def test_flush_when_threshold_reached(self, capsys):
+        """Test that reaching the threshold writes queued lines."""
+        output = OutputBuffer(flush_every=2)
+        output.add("one")
+        assert capsys.readouterr().out == ""
+
+        output.add("two")
+        assert capsys.readouterr().out == "one\ntwo\n"
+        assert output.lines == []
+
+    def test_flush_empty_buffer(self, capsys):
+        """Test that flushing an empty buffer writes nothing."""
+        OutputBuffer().flush()
+
+        assert capsys.readouterr().out == ""
+
+    def test_matches_print_output(self, capsys):
+        """Test that buffered output matches equivalent print calls."""
+        lines = ["\nHeader", "  item 1", "  item 2"]
+
+        for line in lines:
+            print(line)
+        printed = capsys.readouterr().out
+
+        with OutputBuffer() as output:
+            for line in lines:
+                output.add(line)
+
+        assert capsys.readouterr().out == printed
@@ -0,0 +1,134 @@
+"""Tests for the persistent hash cache."""
+import os
+import pytest
+from pathlib import Path
+from src.file_organizer.utils.hash_cache import HashCache
+
+
+class TestHashCache:
+    """Test suite for HashCache class."""
+
+    def test_miss_on_empty_cache(self, temp_dir):
+        """Test that an unknown file has no cached hash."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            assert cache.get(test_file.stat(), 'blake2b') is None
+
+    def test_roundtrip(self, temp_dir):
+        """Test that a stored hash is returned for the unchanged file."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+        stat = test_file.stat()
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            cache.put_many([(stat, 'abc123')], 'blake2b')
+            assert cache.get(stat, 'blake2b') == 'abc123'
+
+    def test_persists_between_instances(self, temp_dir):
+        """Test that hashes survive closing and reopening the cache."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+        stat = test_file.stat()
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            cache.put_many([(stat, 'abc123')], 'blake2b')
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            assert cache.get(stat, 'blake2b') == 'abc123'
+
+    def test_modified_file_misses(self, temp_dir):
+        """Test that a change in size or mtime invalidates the entry."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            cache.put_many([(test_file.stat(), 'abc123')], 'blake2b')
+
+            test_file.write_text('changed content')
+            assert cache.get(test_file.stat(), 'blake2b') is None
+
+    def test_touched_file_misses(self, temp_dir):
+        """Test that a new mtime with the same size invalidates the entry."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            cache.put_many([(test_file.stat(), 'abc123')], 'blake2b')
+
+            stat = test_file.stat()
+            os.utime(test_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            assert cache.get(test_file.stat(), 'blake2b') is None
+
+    def test_algorithms_cached_separately(self, temp_dir):
+        """Test that a digest is only returned for its own algorithm."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+        stat = test_file.stat()
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            cache.put_many([(stat, 'abc123')], 'blake2b')
+            assert cache.get(stat, 'md5') is None
+
+    def test_failed_hashes_not_stored(self, temp_dir):
+        """Test that files whose hash failed are not cached."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+        stat = test_file.stat()
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            cache.put_many([(stat, None)], 'blake2b')
+            assert cache.get(stat, 'blake2b') is None
+
+    def test_batches_large_writes(self, temp_dir):
+        """Test that writes larger than one batch are all stored."""
+        from unittest.mock import patch
+
+        files = []
+        for i in range(5):
+            test_file = temp_dir / f'file{i}.txt'
+            test_file.write_text(f'content {i}')
+            files.append(test_file.stat())
+
+        with patch('src.file_organizer.utils.hash_cache.HASH_CACHE_BATCH_SIZE', 2):
+            with HashCache(temp_dir / 'hashes.db') as cache:
+                cache.put_many([(stat, f'digest{i}') for i, stat in enumerate(files)], 'blake2b')
+                for i, stat in enumerate(files):
+                    assert cache.get(stat, 'blake2b') == f'digest{i}'
+
+    def test_unusable_cache_file_disables_cache(self, temp_dir):
+        """Test that a cache that cannot be opened just misses."""
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+        stat = test_file.stat()
+
+        with HashCache(temp_dir / 'missing' / 'hashes.db') as cache:
+            cache.put_many([(stat, 'abc123')], 'blake2b')
+            assert cache.get(stat, 'blake2b') is None
+
+    def test_outdated_schema_is_replaced(self, temp_dir):
+        """Test that a cache table in another layout is discarded."""
+        import sqlite3
+
+        test_file = temp_dir / 'file.txt'
+        test_file.write_text('content')
+        stat = test_file.stat()
+
+        connection = sqlite3.connect(str(temp_dir / 'hashes.db'))
+        with connection:
+            connection.execute(
+                "CREATE TABLE hashes (dev INTEGER, ino INTEGER, algorithm TEXT, "
+                "size INTEGER, mtime_ns INTEGER, digest TEXT, "
+                "PRIMARY KEY (dev, ino, algorithm))"
+            )
+            connection.execute(
+                "INSERT INTO hashes VALUES (?, ?, ?, ?, ?, ?)",
+                (stat.st_dev, stat.st_ino, 'blake2b', stat.st_size, stat.st_mtime_ns, 'stale')
+            )
+        connection.close()
+
+        with HashCache(temp_dir / 'hashes.db') as cache:
+            assert cache.get(stat, 'blake2b') is None
+            cache.put_many([(stat, 'abc123')], 'blake2b')
+            assert cache.get(stat, 'blake2b') == 'abc123'
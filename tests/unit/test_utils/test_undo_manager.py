@@ -7,6 +7,12 @@ from unittest.mock import patch, MagicMock
 from src.file_organizer.utils.undo_manager import UndoManager
 
 
+def read_log(log_file):
+    """Read a JSON Lines undo log into a list of operations."""
+    with open(log_file, 'r') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
 class TestUndoManagerInit:
     """Test UndoManager initialization."""
 
@@ -16,6 +22,12 @@ class TestUndoManagerInit:
         assert manager.operations == []
         assert manager.log_file is not None
 
+    def test_default_log_keeps_legacy_name(self):
+        """Test that the default log is still found where earlier versions wrote it."""
+        from src.file_organizer.config.settings import UNDO_LOG_FILE
+
+        assert UNDO_LOG_FILE == Path.home() / '.file_organizer_undo.json'
+
     def test_init_custom_log_file(self, temp_dir):
         """Test initialization with custom log file."""
         custom_log = temp_dir / 'custom_undo.json'
@@ -102,8 +114,7 @@ class TestSaveAndLoad:
         assert log_file.exists()
 
         # Verify content
-        with open(log_file, 'r') as f:
-            data = json.load(f)
+        data = read_log(log_file)
         assert len(data) == 2
         assert data[0]['type'] == 'move'
 
@@ -114,10 +125,7 @@ class TestSaveAndLoad:
         manager.save()
 
         assert log_file.exists()
-
-        with open(log_file, 'r') as f:
-            data = json.load(f)
-        assert data == []
+        assert read_log(log_file) == []
 
     def test_load_operations(self, temp_dir):
         """Test loading operations from file."""
@@ -144,6 +152,127 @@ class TestSaveAndLoad:
         assert len(manager.operations) == 1
         assert manager.operations[0]['type'] == 'move'
 
+    def test_save_writes_one_operation_per_line(self, temp_dir):
+        """Test that the log is written as JSON Lines."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+
+        manager.log_operation('move', '/src/file1.txt', '/dst/file1.txt')
+        manager.log_operation('move', '/src/file2.txt', '/dst/file2.txt')
+        manager.save()
+
+        lines = log_file.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])['source'] == '/src/file2.txt'
+
+    def test_repeated_saves_append_new_operations(self, temp_dir):
+        """Test that saving again only appends operations logged since."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+
+        manager.log_operation('move', '/src/file1.txt', '/dst/file1.txt')
+        manager.save()
+        manager.log_operation('move', '/src/file2.txt', '/dst/file2.txt')
+        manager.save()
+        manager.save()
+
+        data = read_log(log_file)
+        assert [op['source'] for op in data] == ['/src/file1.txt', '/src/file2.txt']
+
+    def test_first_save_replaces_previous_log(self, temp_dir):
+        """Test that a new manager's first save overwrites an older log."""
+        log_file = temp_dir / 'undo.json'
+        old_manager = UndoManager(log_file=log_file)
+        old_manager.log_operation('move', '/old/file.txt', '/dst/file.txt')
+        old_manager.save()
+
+        new_manager = UndoManager(log_file=log_file)
+        new_manager.log_operation('move', '/new/file.txt', '/dst/file.txt')
+        new_manager.save()
+
+        data = read_log(log_file)
+        assert [op['source'] for op in data] == ['/new/file.txt']
+
+    def test_save_after_load_appends(self, temp_dir):
+        """Test that operations logged after loading are appended."""
+        log_file = temp_dir / 'undo.json'
+        manager1 = UndoManager(log_file=log_file)
+        manager1.log_operation('move', '/src/file1.txt', '/dst/file1.txt')
+        manager1.save()
+
+        manager2 = UndoManager(log_file=log_file)
+        manager2.load()
+        manager2.log_operation('move', '/src/file2.txt', '/dst/file2.txt')
+        manager2.save()
+
+        assert len(read_log(log_file)) == 2
+
+    def test_save_syncs_once_per_batch(self, temp_dir):
+        """Test that a save of many operations issues a single fsync."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        manager.save()
+        for i in range(10):
+            manager.log_operation('move', f'/src/{i}.txt', f'/dst/{i}.txt')
+
+        with patch('src.file_organizer.utils.undo_manager.os.fsync') as mock_fsync:
+            manager.save(fsync=True)
+
+        mock_fsync.assert_called_once()
+        assert len(read_log(log_file)) == 10
+
+    def test_rewrite_syncs_log_folder(self, temp_dir):
+        """Test that a synced rewrite also syncs the folder holding the log."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        manager.log_operation('move', '/src/a.txt', '/dst/a.txt')
+
+        with patch('src.file_organizer.utils.undo_manager._sync_directory') as mock_sync:
+            manager.save(fsync=True)
+
+        mock_sync.assert_called_once_with(str(temp_dir))
+
+    def test_save_without_fsync(self, temp_dir):
+        """Test that syncing can be turned off per save or by setting."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        manager.log_operation('move', '/src/a.txt', '/dst/a.txt')
+
+        with patch('src.file_organizer.utils.undo_manager.os.fsync') as mock_fsync:
+            manager.save(fsync=False)
+            manager.log_operation('move', '/src/b.txt', '/dst/b.txt')
+            with patch('src.file_organizer.utils.undo_manager.UNDO_LOG_FSYNC', False):
+                manager.save()
+
+        mock_fsync.assert_not_called()
+        assert len(read_log(log_file)) == 2
+
+    def test_rewrite_replaces_log_atomically(self, temp_dir):
+        """Test that a full rewrite goes through a temporary file."""
+        log_file = temp_dir / 'undo.json'
+        log_file.write_text('stale\n')
+        manager = UndoManager(log_file=log_file)
+        manager.log_operation('move', '/src/a.txt', '/dst/a.txt')
+
+        manager.save()
+
+        assert len(read_log(log_file)) == 1
+        assert list(temp_dir.iterdir()) == [log_file]
+
+    def test_roundtrip_without_orjson(self, temp_dir):
+        """Test that the standard library fallback reads and writes the log."""
+        log_file = temp_dir / 'undo.json'
+
+        with patch('src.file_organizer.utils.undo_manager.orjson', None):
+            manager1 = UndoManager(log_file=log_file)
+            manager1.log_operation('move', '/src/file.txt', '/dst/file.txt')
+            manager1.save()
+
+            manager2 = UndoManager(log_file=log_file)
+            assert manager2.load() is True
+
+        assert manager2.operations == manager1.operations
+
     def test_load_nonexistent_file(self, temp_dir):
         """Test loading from nonexistent file."""
         log_file = temp_dir / 'nonexistent.json'
@@ -183,8 +312,7 @@ class TestSaveAndLoad:
 class TestUndoAll:
     """Test undo functionality."""
 
-    @patch('builtins.input', return_value='y')
-    def test_undo_single_operation(self, mock_input, temp_dir):
+    def test_undo_single_operation(self, temp_dir):
         """Test undoing a single file move."""
         log_file = temp_dir / 'undo.json'
 
@@ -202,15 +330,14 @@ class TestUndoAll:
 
         # Undo
         new_manager = UndoManager(log_file=log_file)
-        undone, errors = new_manager.undo_all()
+        undone, errors = new_manager.undo_all(confirm=lambda: True)
 
         assert undone == 1
         assert errors == 0
         assert source.exists()
         assert not dest.exists()
 
-    @patch('builtins.input', return_value='y')
-    def test_undo_multiple_operations(self, mock_input, temp_dir):
+    def test_undo_multiple_operations(self, temp_dir):
         """Test undoing multiple file moves."""
         log_file = temp_dir / 'undo.json'
 
@@ -231,7 +358,7 @@ class TestUndoAll:
 
         # Undo all
         new_manager = UndoManager(log_file=log_file)
-        undone, errors = new_manager.undo_all()
+        undone, errors = new_manager.undo_all(confirm=lambda: True)
 
         assert undone == 3
         assert errors == 0
@@ -240,8 +367,7 @@ class TestUndoAll:
             assert source.exists()
             assert not dest.exists()
 
-    @patch('builtins.input', return_value='n')
-    def test_undo_cancelled_by_user(self, mock_input, temp_dir):
+    def test_undo_cancelled_by_user(self, temp_dir):
         """Test that undo is cancelled when user says no."""
         log_file = temp_dir / 'undo.json'
 
@@ -257,26 +383,43 @@ class TestUndoAll:
 
         # User cancels
         new_manager = UndoManager(log_file=log_file)
-        undone, errors = new_manager.undo_all()
+        undone, errors = new_manager.undo_all(confirm=lambda: False)
 
         assert undone == 0
         assert errors == 0
         assert dest.exists()
         assert not source.exists()
 
+    @patch('builtins.input', return_value='y')
+    def test_undo_asks_on_stdin_by_default(self, mock_input, temp_dir):
+        """Test that undo prompts on stdin when no confirm callback is given."""
+        log_file = temp_dir / 'undo.json'
+        source = temp_dir / 'file.txt'
+        dest = temp_dir / 'moved.txt'
+        dest.write_text('content')
+
+        manager = UndoManager(log_file=log_file)
+        manager.log_operation('move', source, dest)
+        manager.save()
+
+        undone, errors = UndoManager(log_file=log_file).undo_all()
+
+        mock_input.assert_called_once()
+        assert undone == 1
+        assert source.exists()
+
     def test_undo_with_no_operations(self, temp_dir, capsys):
         """Test undo when there are no operations."""
         log_file = temp_dir / 'empty.json'
         manager = UndoManager(log_file=log_file)
         manager.save()
 
-        undone, errors = manager.undo_all()
+        undone, errors = manager.undo_all(confirm=lambda: True)
 
         assert undone == 0
         assert errors == 0
 
-    @patch('builtins.input', return_value='y')
-    def test_undo_missing_destination_file(self, mock_input, temp_dir, capsys):
+    def test_undo_missing_destination_file(self, temp_dir, capsys):
         """Test undo when destination file is missing."""
         log_file = temp_dir / 'undo.json'
 
@@ -289,13 +432,12 @@ class TestUndoAll:
 
         # Don't create the dest file
         new_manager = UndoManager(log_file=log_file)
-        undone, errors = new_manager.undo_all()
+        undone, errors = new_manager.undo_all(confirm=lambda: True)
 
         assert undone == 0
         assert errors == 1
 
-    @patch('builtins.input', return_value='y')
-    def test_undo_reverses_order(self, mock_input, temp_dir):
+    def test_undo_reverses_order(self, temp_dir):
         """Test that undo processes operations in reverse order."""
         log_file = temp_dir / 'undo.json'
         manager = UndoManager(log_file=log_file)
@@ -317,7 +459,7 @@ class TestUndoAll:
 
         # Undo should restore A
         new_manager = UndoManager(log_file=log_file)
-        undone, errors = new_manager.undo_all()
+        undone, errors = new_manager.undo_all(confirm=lambda: True)
 
         assert undone == 2
         assert file_a.exists()
@@ -325,6 +467,147 @@ class TestUndoAll:
         assert not file_c.exists()
 
 
+    def test_undo_legacy_json_array_log(self, temp_dir):
+        """Test undoing a log written in the older single-array format."""
+        log_file = temp_dir / 'undo.json'
+        source = temp_dir / 'file.txt'
+        dest = temp_dir / 'moved.txt'
+        dest.write_text('content')
+
+        with open(log_file, 'w') as f:
+            json.dump([{
+                'type': 'move',
+                'source': str(source),
+                'destination': str(dest),
+                'timestamp': datetime.now().isoformat()
+            }], f, indent=2)
+
+        undone, errors = UndoManager(log_file=log_file).undo_all(confirm=lambda: True)
+
+        assert undone == 1
+        assert errors == 0
+        assert source.exists()
+
+    def test_undo_corrupted_entry_counts_as_error(self, temp_dir):
+        """Test that an unreadable log line is reported as an error."""
+        log_file = temp_dir / 'undo.json'
+        source = temp_dir / 'file.txt'
+        dest = temp_dir / 'moved.txt'
+        dest.write_text('content')
+
+        manager = UndoManager(log_file=log_file)
+        manager.log_operation('move', source, dest)
+        manager.save()
+        with open(log_file, 'r+') as f:
+            content = f.read()
+            f.seek(0)
+            f.write('{ not json\n' + content)
+
+        undone, errors = UndoManager(log_file=log_file).undo_all(confirm=lambda: True)
+
+        assert undone == 1
+        assert errors == 1
+
+    def test_undo_many_independent_operations(self, temp_dir):
+        """Test that a large session spread over several waves is fully undone."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        target = temp_dir / 'organized'
+        target.mkdir()
+
+        for i in range(25):
+            source = temp_dir / f'file{i}.txt'
+            dest = target / f'file{i}.txt'
+            dest.write_text(f'content {i}')
+            manager.log_operation('move', source, dest)
+        manager.save()
+
+        with patch('src.file_organizer.utils.undo_manager.UNDO_BATCH_SIZE', 10):
+            undone, errors = UndoManager(log_file=log_file).undo_all(confirm=lambda: True)
+
+        assert undone == 25
+        assert errors == 0
+        assert all((temp_dir / f'file{i}.txt').exists() for i in range(25))
+        assert not any(target.iterdir())
+
+
+class TestUndoWaves:
+    """Test grouping undo operations into independent waves."""
+
+    def test_independent_moves_share_a_wave(self, temp_dir):
+        """Test that moves touching different paths are grouped together."""
+        manager = UndoManager(log_file=temp_dir / 'undo.json')
+        manager.log_operation('move', temp_dir / 'a.txt', temp_dir / 'x' / 'a.txt')
+        manager.log_operation('move', temp_dir / 'b.txt', temp_dir / 'x' / 'b.txt')
+        manager.save()
+
+        waves = list(manager._iter_undo_waves())
+
+        assert len(waves) == 1
+        assert waves[0][0] == (temp_dir / 'b.txt', temp_dir / 'x' / 'b.txt')
+
+    def test_dependent_moves_split_waves(self, temp_dir):
+        """Test that a path moved twice is undone in separate, ordered waves."""
+        manager = UndoManager(log_file=temp_dir / 'undo.json')
+        manager.log_operation('move', temp_dir / 'a.txt', temp_dir / 'b.txt')
+        manager.log_operation('move', temp_dir / 'b.txt', temp_dir / 'c.txt')
+        manager.save()
+
+        waves = list(manager._iter_undo_waves())
+
+        assert waves == [
+            [(temp_dir / 'b.txt', temp_dir / 'c.txt')],
+            [(temp_dir / 'a.txt', temp_dir / 'b.txt')]
+        ]
+
+    def test_waves_limited_to_batch_size(self, temp_dir):
+        """Test that no wave holds more than the batch size."""
+        manager = UndoManager(log_file=temp_dir / 'undo.json')
+        for i in range(5):
+            manager.log_operation('move', temp_dir / f'{i}.txt', temp_dir / f'moved{i}.txt')
+        manager.save()
+
+        waves = list(manager._iter_undo_waves(batch_size=2))
+
+        assert [len(wave) for wave in waves] == [2, 2, 1]
+
+
+class TestReadReversed:
+    """Test streaming the undo log backwards."""
+
+    def test_lines_read_newest_first(self, temp_dir):
+        """Test that records come back in reverse order across blocks."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        for i in range(50):
+            manager.log_operation('move', f'/src/file{i}.txt', f'/dst/file{i}.txt')
+        manager.save()
+
+        lines = list(manager._read_lines_reversed(block_size=7))
+
+        sources = [json.loads(line)['source'] for line in lines]
+        assert sources == [f'/src/file{i}.txt' for i in reversed(range(50))]
+
+    def test_count_lines(self, temp_dir):
+        """Test counting records without parsing them."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        for i in range(12):
+            manager.log_operation('move', f'/src/{i}', f'/dst/{i}')
+        manager.save()
+
+        assert manager._count_lines(block_size=5) == 12
+
+    def test_empty_log(self, temp_dir):
+        """Test reading an empty log."""
+        log_file = temp_dir / 'undo.json'
+        manager = UndoManager(log_file=log_file)
+        manager.save()
+
+        assert list(manager._read_lines_reversed()) == []
+        assert manager._count_lines() == 0
+
+
 class TestClear:
     """Test clearing operations."""
 
@@ -353,9 +636,7 @@ class TestClear:
         manager.clear()
 
         # Verify file is empty
-        with open(log_file, 'r') as f:
-            data = json.load(f)
-        assert data == []
+        assert read_log(log_file) == []
 
     def test_clear_empty_operations(self, temp_dir):
         """Test clearing when already empty."""
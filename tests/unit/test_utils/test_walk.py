@@ -0,0 +1,154 @@
+"""Tests for directory traversal utilities."""
+import os
+import pytest
+from pathlib import Path
+from src.file_organizer.utils.walk import file_extension, iter_files, iter_files_parallel
+
+
+class TestFileExtension:
+    """Test suite for file_extension."""
+
+    @pytest.mark.parametrize('name', [
+        'photo.jpg', 'archive.tar.gz', 'README', '.bashrc', '.bashrc.bak',
+        '..hidden', '..hidden.txt', 'trailing.', 'double..dot', '.', '..', ''
+    ])
+    def test_matches_splitext(self, name):
+        """Test that extensions match os.path.splitext."""
+        assert file_extension(name) == os.path.splitext(name)[1]
+
+
+class TestIterFiles:
+    """Test suite for iter_files function."""
+
+    def test_empty_directory(self, temp_dir):
+        """Test walking an empty directory."""
+        assert list(iter_files(temp_dir)) == []
+
+    def test_top_level_files(self, temp_dir):
+        """Test that top-level files are yielded."""
+        (temp_dir / 'a.txt').write_text('a')
+        (temp_dir / 'b.txt').write_text('b')
+
+        names = sorted(entry.name for entry in iter_files(temp_dir))
+
+        assert names == ['a.txt', 'b.txt']
+
+    def test_nested_files(self, nested_directory, temp_dir):
+        """Test that files in nested folders are yielded."""
+        paths = {Path(entry.path) for entry in iter_files(temp_dir)}
+
+        expected = {path for files in nested_directory.values() for path in files}
+        assert paths == expected
+
+    def test_directories_not_yielded(self, temp_dir):
+        """Test that directories themselves are not yielded."""
+        (temp_dir / 'empty_folder').mkdir()
+        (temp_dir / 'folder').mkdir()
+        (temp_dir / 'folder' / 'file.txt').write_text('content')
+
+        names = [entry.name for entry in iter_files(temp_dir)]
+
+        assert names == ['file.txt']
+
+    def test_entries_provide_size(self, temp_dir):
+        """Test that yielded entries expose stat information."""
+        (temp_dir / 'sized.bin').write_bytes(b'X' * 123)
+
+        entries = list(iter_files(temp_dir))
+
+        assert entries[0].stat().st_size == 123
+
+    def test_accepts_string_path(self, temp_dir):
+        """Test walking a directory given as a string."""
+        (temp_dir / 'file.txt').write_text('content')
+
+        assert len(list(iter_files(str(temp_dir)))) == 1
+
+    def test_nonexistent_directory(self, temp_dir):
+        """Test walking a directory that doesn't exist."""
+        assert list(iter_files(temp_dir / 'missing')) == []
+
+    @pytest.mark.skipif(not hasattr(os, 'symlink'), reason="symlinks not supported")
+    def test_symlinked_directories_not_traversed(self, temp_dir):
+        """Test that links to files are yielded but links to folders are not walked."""
+        target_dir = temp_dir / 'real'
+        target_dir.mkdir()
+        (target_dir / 'file.txt').write_text('content')
+
+        try:
+            (temp_dir / 'link_dir').symlink_to(target_dir, target_is_directory=True)
+            (temp_dir / 'link_file.txt').symlink_to(target_dir / 'file.txt')
+        except OSError:
+            pytest.skip("symlinks not permitted")
+
+        paths = sorted(Path(entry.path) for entry in iter_files(temp_dir))
+
+        assert paths == [temp_dir / 'link_file.txt', target_dir / 'file.txt']
+
+    @pytest.mark.skipif(not hasattr(os, 'symlink'), reason="symlinks not supported")
+    def test_exclude_symlinks(self, temp_dir):
+        """Test that links to files can be left out."""
+        (temp_dir / 'file.txt').write_text('content')
+        try:
+            (temp_dir / 'link.txt').symlink_to(temp_dir / 'file.txt')
+        except OSError:
+            pytest.skip("symlinks not permitted")
+
+        names = [entry.name for entry in iter_files(temp_dir, include_symlinks=False)]
+        parallel = [entry.name for entry in iter_files_parallel(temp_dir, 4, include_symlinks=False)]
+
+        assert names == parallel == ['file.txt']
+
+
+class TestIterFilesParallel:
+    """Test suite for iter_files_parallel function."""
+
+    def test_empty_directory(self, temp_dir):
+        """Test walking an empty directory."""
+        assert list(iter_files_parallel(temp_dir)) == []
+
+    def test_matches_serial_walk(self, temp_dir):
+        """Test that the parallel walk finds exactly the serial walk's files."""
+        for i in range(6):
+            sub = temp_dir / f'dir{i}' / 'inner'
+            sub.mkdir(parents=True)
+            (sub / f'deep{i}.txt').write_text('deep')
+            (sub.parent / f'mid{i}.txt').write_text('mid')
+        (temp_dir / 'top.txt').write_text('top')
+
+        parallel = sorted(entry.path for entry in iter_files_parallel(temp_dir, workers=4))
+        serial = sorted(entry.path for entry in iter_files(temp_dir))
+
+        assert len(parallel) == 13
+        assert parallel == serial
+
+    def test_single_worker_walks_serially(self, temp_dir):
+        """Test that workers=1 does not start a thread pool."""
+        from unittest.mock import patch
+
+        (temp_dir / 'a.txt').write_text('a')
+
+        with patch('src.file_organizer.utils.walk.ThreadPoolExecutor') as mock_pool:
+            names = [entry.name for entry in iter_files_parallel(temp_dir, workers=1)]
+
+        assert names == ['a.txt']
+        mock_pool.assert_not_called()
+
+    def test_nonexistent_directory(self, temp_dir):
+        """Test that a missing directory yields nothing."""
+        assert list(iter_files_parallel(temp_dir / 'missing', workers=4)) == []
+
+    def test_symlinks_not_followed(self, temp_dir):
+        """Test that symlinked directories are not descended into."""
+        target = temp_dir / 'target'
+        target.mkdir()
+        (target / 'file.txt').write_text('content')
+        link = temp_dir / 'link'
+        try:
+            link.symlink_to(target, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported")
+
+        paths = [Path(entry.path) for entry in iter_files_parallel(temp_dir, workers=4)]
+
+        assert paths == [target / 'file.txt']